@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Stock analysis command-line tool.
+
+This script combines the single stock, multiple stocks and dual analysis
+examples into one entry point, with a subcommand for each:
+    
+    python -m examples.analyze single AAPL
+    python -m examples.analyze multi AAPL MSFT GOOGL
+    python -m examples.analyze dual AAPL,MSFT,GOOGL --save-reports
+"""
+
+import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from stock_analyzer.analyzer import analyze_stock, analyze_multiple, dual_analysis
+from stock_analyzer.utils.cache_utils import set_cache_enabled
+
+def _tickers(value):
+    """Split a command-line argument like 'aapl,msft' into ['AAPL', 'MSFT']."""
+    return [ticker.strip().upper() for ticker in value.split(',') if ticker.strip()]
+
+def _confirm(question):
+    """Ask a yes/no question on the console and return True if the answer is 'y'."""
+    print(f"{question} (y/n)")
+    return input().strip().lower() == 'y'
+
+def run_single(args):
+    """Run a single stock analysis."""
+    # Analyze the stock
+    print(f"Analyzing {args.ticker} from {args.analysis_type.replace('_', '/')} perspective...")
+    report = analyze_stock(args.ticker, args.analysis_type)
+    
+    if report is None:
+        print(f"Error analyzing {args.ticker}")
+        return 1
+    
+    print(f"\nAnalysis completed: {report.classification}")
+    return 0
+
+def run_multi(args):
+    """Run a multiple stock analysis."""
+    # Flatten the per-argument groups into a single list of tickers
+    tickers = [ticker for group in args.tickers for ticker in group]
+    
+    # Non-interactive runs always include the detailed comparison; otherwise ask up front
+    show_comparison = len(tickers) > 1 and (
+        args.no_interactive or _confirm("Would you like to see a detailed comparison?"))
+    
+    # Analyze the stocks
+    print(f"Analyzing {', '.join(tickers)} from {args.analysis_type.replace('_', '/')} perspective...")
+    analyze_multiple(tickers, args.analysis_type, args.workers, show_comparison)
+    
+    return 0
+
+def run_dual(args):
+    """Run a dual analysis."""
+    # Flatten the per-argument groups into a single list of tickers
+    tickers = [ticker for group in args.tickers for ticker in group]
+    
+    # Ask up front whether to include the detailed comparisons
+    show_comparison = (not args.no_interactive and len(tickers) > 1
+                       and _confirm("Would you like to see detailed comparisons?"))
+    
+    # Perform dual analysis
+    print(f"Performing dual analysis on {', '.join(tickers)}...")
+    dual_report = dual_analysis(tickers, args.workers, show_comparison)
+    
+    # Save reports if requested
+    if args.save_reports:
+        from stock_analyzer.utils.display_utils import save_report_html
+        
+        print("\nSaving HTML reports...")
+        jobs = [
+            (report, f"{ticker}_{analysis_type}.html")
+            for analysis_type, data in dual_report.items()
+            for ticker, report in data['reports'].items()
+        ]
+        
+        # Render and write the files concurrently to overlap disk I/O
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda job: save_report_html(*job), jobs))
+    
+    return 0
+
+def build_parser(progs=None):
+    """
+    Build the argument parser with one subcommand per analysis mode.
+    
+    Args:
+        progs (dict, optional): Program name to show in a subcommand's usage messages,
+            by subcommand. Defaults to "analyze.py <subcommand>".
+    
+    Returns:
+        argparse.ArgumentParser: Parser for the analyze command line
+    """
+    progs = progs or {}
+    parser = argparse.ArgumentParser(description='Analyze stocks from value and growth/momentum perspectives')
+    subparsers = parser.add_subparsers(dest='cmd', required=True)
+    
+    # Single stock analysis
+    single = subparsers.add_parser('single', prog=progs.get('single'), help='Analyze a single stock')
+    single.add_argument('ticker', type=str.upper, help='Stock ticker symbol (e.g., AAPL)')
+    single.add_argument('--analysis-type', type=str, choices=['value', 'growth_momentum'], 
+                        default='value', help='Type of analysis to perform')
+    single.add_argument('--no-cache', action='store_true', help="Ignore cached reports and stock data and fetch fresh data")
+    single.set_defaults(func=run_single)
+    
+    # Multiple stock analysis
+    multi = subparsers.add_parser('multi', prog=progs.get('multi'), help='Analyze multiple stocks')
+    multi.add_argument('tickers', type=_tickers, nargs='+', help='Stock ticker symbols (e.g., AAPL MSFT GOOGL or AAPL,MSFT,GOOGL)')
+    multi.add_argument('--analysis-type', type=str, choices=['value', 'growth_momentum'], 
+                       default='value', help='Type of analysis to perform')
+    multi.add_argument('--no-interactive', action='store_true', help='Skip interactive prompts')
+    multi.add_argument('--workers', type=int, default=8, help='Number of threads used to fetch stock data')
+    multi.add_argument('--no-cache', action='store_true', help="Ignore cached reports and stock data and fetch fresh data")
+    multi.set_defaults(func=run_multi)
+    
+    # Dual analysis
+    dual = subparsers.add_parser('dual', prog=progs.get('dual'), help='Perform dual analysis on stocks')
+    dual.add_argument('tickers', type=_tickers, nargs='+', help='Stock ticker symbols (e.g., AAPL MSFT GOOGL or AAPL,MSFT,GOOGL)')
+    dual.add_argument('--no-interactive', action='store_true', help='Skip interactive prompts')
+    dual.add_argument('--workers', type=int, default=8, help='Number of threads used to fetch stock data')
+    dual.add_argument('--save-reports', action='store_true', help='Save HTML reports for each stock')
+    dual.add_argument('--no-cache', action='store_true', help="Ignore cached reports and stock data and fetch fresh data")
+    dual.set_defaults(func=run_dual)
+    
+    return parser
+
+def main(argv=None, prog=None):
+    """
+    Parse command line arguments and run the selected analysis.
+    
+    Args:
+        argv (list, optional): Arguments to parse instead of sys.argv[1:]
+        prog (str, optional): Program name to show in usage messages instead of
+            "analyze.py <subcommand>", for scripts that always run argv[0]'s subcommand
+    
+    Returns:
+        int: Exit status
+    """
+    args = build_parser({argv[0]: prog} if prog else None).parse_args(argv)
+    if args.no_cache:
+        set_cache_enabled(False)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
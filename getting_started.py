@@ -8,6 +8,7 @@ comparing multiple companies, and performing dual analysis.
 
 To run:
     python getting_started.py
+    python getting_started.py --non-interactive   # no pauses, e.g. for timing
 
 Requirements:
     - stock_analyzer package installed
@@ -16,16 +17,20 @@ Requirements:
 
 import os
 import time
+import argparse
 from datetime import datetime
 import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 
 # Import the main analysis functions
 from stock_analyzer.analyzer import analyze_stock, analyze_multiple, dual_analysis
 from stock_analyzer.utils.display_utils import save_report_html
-from stock_analyzer.criteria.value_criteria import VALUE_CRITERIA, VALUE_DESCRIPTIONS
-from stock_analyzer.criteria.growth_criteria import GROWTH_MOMENTUM_CRITERIA, GROWTH_MOMENTUM_DESCRIPTIONS
+from stock_analyzer.criteria.tables import RATINGS
+from stock_analyzer.criteria.value_criteria import (
+    VALUE_DESCRIPTIONS, VALUE_CRITERIA_TEXT, VALUE_METRIC_INDEX, VALUE_MINS, VALUE_MAXS
+)
+from stock_analyzer.criteria.growth_criteria import (
+    GROWTH_MOMENTUM_DESCRIPTIONS, GROWTH_MOMENTUM_CRITERIA_TEXT, GROWTH_MOMENTUM_METRIC_INDEX, GROWTH_MOMENTUM_MINS
+)
 
 def print_section_header(title):
     """Print a formatted section header to make output more readable"""
@@ -33,11 +38,9 @@ def print_section_header(title):
     print(f" {title} ".center(80, "="))
     print("="*80 + "\n")
 
-def print_ratio_info(criteria_dict, descriptions_dict):
+def print_ratio_info(criteria_text, descriptions_dict):
     """Print detailed information about financial ratios"""
     for ratio_name, description in descriptions_dict.items():
-        criteria = criteria_dict.get(ratio_name, {})
-        
         print(f"\n{description.get('name', ratio_name.upper())}:")
         print(f"  What it means: {description.get('description', 'No description available')}")
         print(f"  How to interpret: {description.get('interpretation', 'No interpretation available')}")
@@ -47,17 +50,26 @@ def print_ratio_info(criteria_dict, descriptions_dict):
         elif 'growth_stock_ideal' in description:
             print(f"  Ideal for growth investing: {description.get('growth_stock_ideal')}")
         
-        if criteria:
+        # Rating ranges are pre-formatted when the criteria module is imported
+        if ratio_name in criteria_text:
             print("  Rating criteria:")
-            for rating, (min_val, max_val) in criteria.items():
-                min_str = f"{min_val:.2f}" if min_val != float('-inf') else "-infinity"
-                max_str = f"{max_val:.2f}" if max_val != float('inf') else "infinity"
-                print(f"    - {rating.upper()}: {min_str} to {max_str}")
+            print(criteria_text[ratio_name])
         
         print("-" * 50)
 
+def confirm(question):
+    """Ask a yes/no question and return True if the answer is 'y'"""
+    print(f"{question} (y/n)")
+    return input().strip().lower() == 'y'
+
 def main():
     """Main function demonstrating Stock Analyzer functionality"""
+    parser = argparse.ArgumentParser(description='Stock Analyzer tutorial')
+    parser.add_argument('--non-interactive', action='store_true',
+                        help='Run straight through without pausing for input (e.g. for timing runs)')
+    args = parser.parse_args()
+    interactive = not args.non_interactive
+    
     # Welcome message
     print_section_header("STOCK ANALYZER TUTORIAL")
     print("Welcome to the Stock Analyzer tutorial! This script will walk you through")
@@ -68,13 +80,13 @@ def main():
     print_section_header("VALUE INVESTING RATIOS")
     print("Value investing focuses on finding companies trading below their intrinsic value.")
     print("Here are the key ratios used in value analysis:\n")
-    print_ratio_info(VALUE_CRITERIA, VALUE_DESCRIPTIONS)
+    print_ratio_info(VALUE_CRITERIA_TEXT, VALUE_DESCRIPTIONS)
     
     print_section_header("GROWTH & MOMENTUM INVESTING RATIOS")
     print("Growth investing focuses on companies with strong growth potential.")
     print("Momentum investing focuses on stocks with strong price trends.")
     print("Here are the key metrics used in growth and momentum analysis:\n")
-    print_ratio_info(GROWTH_MOMENTUM_CRITERIA, GROWTH_MOMENTUM_DESCRIPTIONS)
+    print_ratio_info(GROWTH_MOMENTUM_CRITERIA_TEXT, GROWTH_MOMENTUM_DESCRIPTIONS)
     
     # Single Stock Analysis
     print_section_header("SINGLE STOCK ANALYSIS: APPLE (AAPL)")
@@ -84,13 +96,15 @@ def main():
     apple_value_report = analyze_stock("AAPL", analysis_type="value")
     
     # Wait for user to review
-    input("\nPress Enter to continue to Apple's growth analysis...\n")
+    if interactive:
+        input("\nPress Enter to continue to Apple's growth analysis...\n")
     
     print("Analyzing Apple from a growth/momentum perspective...")
     apple_growth_report = analyze_stock("AAPL", analysis_type="growth_momentum")
     
     # Wait for user to review
-    input("\nPress Enter to continue to multiple stock analysis...\n")
+    if interactive:
+        input("\nPress Enter to continue to multiple stock analysis...\n")
     
     # Multiple Stock Analysis
     print_section_header("COMPARING MULTIPLE TECH STOCKS")
@@ -101,23 +115,30 @@ def main():
     print(f"Stocks to analyze: {', '.join(tech_stocks)}")
     
     print("\nAnalyzing from a value investing perspective...")
-    value_results, value_reports = analyze_multiple(tech_stocks, analysis_type="value")
+    show_comparison = interactive and confirm("Would you like to see a detailed comparison?")
+    value_results, value_reports, value_errors = analyze_multiple(tech_stocks, analysis_type="value",
+                                                                  show_comparison=show_comparison)
     
     # Wait for user to review
-    input("\nPress Enter to continue to growth comparison...\n")
+    if interactive:
+        input("\nPress Enter to continue to growth comparison...\n")
     
     print("Analyzing from a growth/momentum perspective...")
-    growth_results, growth_reports = analyze_multiple(tech_stocks, analysis_type="growth_momentum")
+    show_comparison = interactive and confirm("Would you like to see a detailed comparison?")
+    growth_results, growth_reports, growth_errors = analyze_multiple(tech_stocks, analysis_type="growth_momentum",
+                                                                     show_comparison=show_comparison)
     
     # Wait for user to review
-    input("\nPress Enter to continue to dual analysis...\n")
+    if interactive:
+        input("\nPress Enter to continue to dual analysis...\n")
     
     # Dual Analysis
     print_section_header("COMPREHENSIVE DUAL ANALYSIS")
     print("Finally, let's perform a dual analysis which examines stocks from both")
     print("value and growth perspectives simultaneously:\n")
     
-    dual_report = dual_analysis(tech_stocks)
+    show_comparison = interactive and confirm("Would you like to see detailed comparisons?")
+    dual_report = dual_analysis(tech_stocks, show_comparison=show_comparison)
     
     # Generate visualizations if matplotlib is available
     try:
@@ -126,86 +147,83 @@ def main():
         
         # Extract key value metrics for comparison
         value_metrics = ['pe_ratio', 'pb_ratio', 'roe', 'debt_to_equity']
-        value_data = []
-        
-        for ticker in tech_stocks:
-            report = value_reports.get(ticker)
-            if not isinstance(report, str) and hasattr(report, 'ratios'):
-                row = {'Ticker': ticker}
-                for metric in value_metrics:
-                    row[VALUE_DESCRIPTIONS[metric]['name']] = report.ratios.get(metric, np.nan)
-                value_data.append(row)
+        value_names = {metric: VALUE_DESCRIPTIONS[metric]['name'] for metric in value_metrics}
+        # 'Great' rating bounds for the plotted metrics, one array slice each
+        value_rows = [VALUE_METRIC_INDEX[metric] for metric in value_metrics]
+        value_great_min = VALUE_MINS[value_rows, RATINGS.index('great')]
+        value_great_max = VALUE_MAXS[value_rows, RATINGS.index('great')]
         
-        # Create DataFrame for visualization
-        value_df = pd.DataFrame(value_data)
+        # Create DataFrame for visualization (one row per ticker, one column per metric)
+        value_df = pd.DataFrame({
+            ticker: pd.Series(report.ratios, dtype=float)
+            for ticker, report in value_reports.items()
+        }).T.reindex(columns=value_metrics).rename(columns=value_names).rename_axis('Ticker')
         
         # Create the visualization
         if not value_df.empty and len(value_df) > 1:
-            fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-            axes = axes.flatten()
+            # Import matplotlib and numpy only when there is something to plot.
+            # The figures are only written to PNG files, so use the headless Agg backend.
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+            import numpy as np
             
-            for i, metric in enumerate(value_metrics):
-                metric_name = VALUE_DESCRIPTIONS[metric]['name']
-                ax = axes[i]
-                value_df.plot(x='Ticker', y=metric_name, kind='bar', ax=ax, color='skyblue')
-                ax.set_title(metric_name)
+            # Draw all four metrics in a single call, one subplot per column
+            axes = value_df.plot(kind='bar', subplots=True, layout=(2, 2), figsize=(15, 10), sharex=False,
+                                 color='skyblue', legend=False, title=list(value_df.columns))
+            
+            for ax, metric, great_min, great_max in zip(axes.flat, value_metrics, value_great_min, value_great_max):
+                metric_name = value_names[metric]
                 ax.set_ylabel(metric_name)
                 
                 # Add horizontal lines for 'great' thresholds
-                criteria = VALUE_CRITERIA[metric]
-                if criteria['great'][1] != float('inf'):
-                    ax.axhline(y=criteria['great'][1], color='green', linestyle='--', alpha=0.7, label='Great threshold')
-                if criteria['great'][0] > 0:
-                    ax.axhline(y=criteria['great'][0], color='green', linestyle='--', alpha=0.7)
+                if np.isfinite(great_max):
+                    ax.axhline(y=great_max, color='green', linestyle='--', alpha=0.7, label='Great threshold')
+                if great_min > 0:
+                    ax.axhline(y=great_min, color='green', linestyle='--', alpha=0.7)
                 
-                # Add annotations
-                for j, v in enumerate(value_df[metric_name]):
-                    if not np.isnan(v):
-                        ax.text(j, v + 0.05, f"{v:.2f}", ha='center')
+                # Add annotations (blank for missing values)
+                values = value_df[metric_name]
+                ax.bar_label(ax.containers[0], labels=values.map('{:.2f}'.format).where(values.notna(), ''))
             
-            plt.tight_layout()
-            plt.savefig('value_metrics_comparison.png')
+            fig = axes.flat[0].get_figure()
+            fig.tight_layout()
+            fig.savefig('value_metrics_comparison.png', dpi=100, bbox_inches=None)
+            plt.close(fig)
             print("Value metrics visualization saved as 'value_metrics_comparison.png'")
             
             # Growth metrics visualization
             growth_metrics = ['revenue_growth', 'earnings_growth', 'price_performance_1y', 'relative_strength']
-            growth_data = []
-            
-            for ticker in tech_stocks:
-                report = growth_reports.get(ticker)
-                if not isinstance(report, str) and hasattr(report, 'ratios'):
-                    row = {'Ticker': ticker}
-                    for metric in growth_metrics:
-                        if metric in GROWTH_MOMENTUM_DESCRIPTIONS:
-                            row[GROWTH_MOMENTUM_DESCRIPTIONS[metric]['name']] = report.ratios.get(metric, np.nan)
-                    growth_data.append(row)
+            growth_names = {metric: GROWTH_MOMENTUM_DESCRIPTIONS[metric]['name'] for metric in growth_metrics}
+            growth_rows = [GROWTH_MOMENTUM_METRIC_INDEX[metric] for metric in growth_metrics]
+            growth_great_min = GROWTH_MOMENTUM_MINS[growth_rows, RATINGS.index('great')]
             
             # Create DataFrame for visualization
-            growth_df = pd.DataFrame(growth_data)
+            growth_df = pd.DataFrame({
+                ticker: pd.Series(report.ratios, dtype=float)
+                for ticker, report in growth_reports.items()
+            }).T.reindex(columns=growth_metrics).rename(columns=growth_names).rename_axis('Ticker')
             
             if not growth_df.empty and len(growth_df) > 1:
-                fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-                axes = axes.flatten()
+                # Draw all four metrics in a single call, one subplot per column
+                axes = growth_df.plot(kind='bar', subplots=True, layout=(2, 2), figsize=(15, 10), sharex=False,
+                                      color='purple', legend=False, title=list(growth_df.columns))
                 
-                for i, metric in enumerate(growth_metrics):
-                    if metric in GROWTH_MOMENTUM_DESCRIPTIONS:
-                        metric_name = GROWTH_MOMENTUM_DESCRIPTIONS[metric]['name']
-                        ax = axes[i]
-                        growth_df.plot(x='Ticker', y=metric_name, kind='bar', ax=ax, color='purple')
-                        ax.set_title(metric_name)
-                        ax.set_ylabel(metric_name)
-                        
-                        # Add horizontal lines for 'great' thresholds
-                        criteria = GROWTH_MOMENTUM_CRITERIA[metric]
-                        ax.axhline(y=criteria['great'][0], color='green', linestyle='--', alpha=0.7, label='Great threshold')
-                        
-                        # Add annotations
-                        for j, v in enumerate(growth_df[metric_name]):
-                            if not np.isnan(v):
-                                ax.text(j, v + 0.01, f"{v:.2f}", ha='center')
+                for ax, metric, great_min in zip(axes.flat, growth_metrics, growth_great_min):
+                    metric_name = growth_names[metric]
+                    ax.set_ylabel(metric_name)
+                    
+                    # Add horizontal lines for 'great' thresholds
+                    ax.axhline(y=great_min, color='green', linestyle='--', alpha=0.7, label='Great threshold')
+                    
+                    # Add annotations (blank for missing values)
+                    values = growth_df[metric_name]
+                    ax.bar_label(ax.containers[0], labels=values.map('{:.2f}'.format).where(values.notna(), ''))
                 
-                plt.tight_layout()
-                plt.savefig('growth_metrics_comparison.png')
+                fig = axes.flat[0].get_figure()
+                fig.tight_layout()
+                fig.savefig('growth_metrics_comparison.png', dpi=100, bbox_inches=None)
+                plt.close(fig)
                 print("Growth metrics visualization saved as 'growth_metrics_comparison.png'")
         else:
             print("Not enough valid data for visualization")
@@ -226,6 +244,13 @@ def main():
         html_file = save_report_html(apple_growth_report, "AAPL_growth_analysis.html")
         print(f"Apple growth analysis report saved to {html_file}")
     
+    # Report any tickers that could not be analyzed
+    errors = {**value_errors, **growth_errors}
+    if errors:
+        print_section_header("ERRORS")
+        for ticker, error in errors.items():
+            print(f"  {ticker}: {error}")
+    
     # Conclusion
     print_section_header("CONCLUSION")
     print("This tutorial has demonstrated the key functionality of the Stock Analyzer package:")
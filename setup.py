@@ -23,4 +23,8 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        # Compiles batch rating counts; a NumPy fallback is used without it
+        "fast": ["numba"],
+    },
 )
\ No newline at end of file
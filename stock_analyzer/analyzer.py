@@ -2,18 +2,50 @@
 Core stock analyzer module containing the main StockAnalyzer class.
 """
 
+import bisect
+import functools
+import warnings
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from tabulate import tabulate
-from IPython.display import display, HTML, Markdown
 
 from stock_analyzer.models.stock_data import StockData
 from stock_analyzer.models.report import StockReport
-from stock_analyzer.utils.fetch_utils import fetch_stock_data
+from stock_analyzer.utils.fetch_utils import fetch_stock_data, _fetch_stock_data, batch_fetch
 from stock_analyzer.utils.display_utils import print_report
-from stock_analyzer.criteria.value_criteria import VALUE_CRITERIA, VALUE_DESCRIPTIONS
-from stock_analyzer.criteria.growth_criteria import GROWTH_MOMENTUM_CRITERIA, GROWTH_MOMENTUM_DESCRIPTIONS
+from stock_analyzer.utils.cache_utils import disk_cache, memory_cache
+from stock_analyzer.criteria.tables import RATINGS, build_rating_edges, build_rating_table
+from stock_analyzer.criteria.compiled import count_ratings
+from stock_analyzer.criteria.value_criteria import (
+    VALUE_CRITERIA, VALUE_DESCRIPTIONS, VALUE_SHORT_INTERPRETATIONS, VALUE_GREAT_RANGES
+)
+from stock_analyzer.criteria.growth_criteria import (
+    GROWTH_MOMENTUM_CRITERIA, GROWTH_MOMENTUM_DESCRIPTIONS,
+    GROWTH_MOMENTUM_SHORT_INTERPRETATIONS, GROWTH_MOMENTUM_GREAT_RANGES
+)
+
+
+# Ratios read straight from the yfinance info dict:
+# (ratio name, info keys tried in order, default when none of them is set)
+_VALUE_RATIO_KEYS = (
+    ('pe_ratio', ('trailingPE', 'forwardPE'), None),
+    ('pb_ratio', ('priceToBook',), None),
+    ('ps_ratio', ('priceToSalesTrailing12Months',), None),
+    ('debt_to_equity', ('debtToEquity',), None),
+    ('roe', ('returnOnEquity',), None),
+    ('current_ratio', ('currentRatio',), None),
+    ('dividend_yield', ('dividendYield',), 0),
+    ('profit_margin', ('profitMargins',), None),
+    ('peg_ratio', ('pegRatio',), None),
+)
+_GROWTH_RATIO_KEYS = (
+    ('revenue_growth', ('revenueGrowth',), None),
+    ('earnings_growth', ('earningsGrowth',), None),
+    ('eps_growth', ('earningsQuarterlyGrowth',), None),
+    ('gross_margin', ('grossMargins',), None),
+    ('operating_margin', ('operatingMargins',), None),
+    ('analyst_recommendation', ('recommendationMean',), None),
+)
 
 
 class StockAnalyzer:
@@ -33,7 +65,7 @@ class StockAnalyzer:
         self.growth_momentum_criteria = GROWTH_MOMENTUM_CRITERIA
         
         # Set current criteria to value by default
-        self.classification_criteria = self.value_criteria.copy()
+        self.classification_criteria = self.value_criteria
         
         # Value investing ratio descriptions
         self.value_descriptions = VALUE_DESCRIPTIONS
@@ -42,7 +74,19 @@ class StockAnalyzer:
         self.growth_momentum_descriptions = GROWTH_MOMENTUM_DESCRIPTIONS
         
         # Set current descriptions to value by default
-        self.ratio_descriptions = self.value_descriptions.copy()
+        self.ratio_descriptions = self.value_descriptions
+        
+        # Sorted rating range edges per ratio, used to classify values with bisect
+        self._rating_edges = {
+            'value': build_rating_edges(self.value_criteria),
+            'growth_momentum': build_rating_edges(self.growth_momentum_criteria)
+        }
+        
+        # The same edges as arrays, used to count ratings for a whole batch in one call
+        self._rating_tables = {
+            'value': build_rating_table(self.value_criteria),
+            'growth_momentum': build_rating_table(self.growth_momentum_criteria)
+        }
     
     def test_connection(self):
         """
@@ -53,7 +97,8 @@ class StockAnalyzer:
         """
         try:
             test_ticker = "AAPL"  # Use a reliable ticker for testing
-            stock_data = fetch_stock_data(test_ticker)
+            # Bypass the caches, which would report success while offline
+            stock_data = _fetch_stock_data(test_ticker)
             if stock_data and stock_data.info and 'shortName' in stock_data.info:
                 print(f"Connection successful! Retrieved data for {stock_data.info.get('shortName', test_ticker)}")
                 return True
@@ -82,56 +127,32 @@ class StockAnalyzer:
         income_stmt = stock_data.income_stmt
         balance_sheet = stock_data.balance_sheet
         historical_data = stock_data.historical_data
-        market_data = stock_data.market_data
         current_price = stock_data.current_price
         
         # Initialize ratios dictionary
         ratios = {}
         
         # Calculate basic value ratios regardless of analysis type (needed for both)
-        ratios['pe_ratio'] = info.get('trailingPE', info.get('forwardPE', None))
-        ratios['pb_ratio'] = info.get('priceToBook', None)
-        ratios['ps_ratio'] = info.get('priceToSalesTrailing12Months', None)
-        ratios['debt_to_equity'] = info.get('debtToEquity', None) / 100 if info.get('debtToEquity') else None
-        ratios['roe'] = info.get('returnOnEquity', None)
-        ratios['current_ratio'] = info.get('currentRatio', None)
-        ratios['dividend_yield'] = info.get('dividendYield', 0)
-        ratios['profit_margin'] = info.get('profitMargins', None)
-        ratios['peg_ratio'] = info.get('pegRatio', None)
+        for ratio_name, keys, default in _VALUE_RATIO_KEYS:
+            ratios[ratio_name] = next((info[key] for key in keys if info.get(key) is not None), default)
+        
+        # yfinance reports debt to equity as a percentage
+        ratios['debt_to_equity'] = ratios['debt_to_equity'] / 100 if ratios['debt_to_equity'] else None
         
         # If analysis type is growth_momentum, calculate additional ratios
         if analysis_type == 'growth_momentum' and historical_data is not None:
-            # Calculate price performance metrics
-            if not historical_data.empty:
-                # 6-month price performance
-                six_month_ago_idx = len(historical_data) - min(len(historical_data), 126)  # ~6 months of trading days
-                if six_month_ago_idx >= 0 and six_month_ago_idx < len(historical_data):
-                    start_price = historical_data['Close'].iloc[six_month_ago_idx]
-                    end_price = historical_data['Close'].iloc[-1]
-                    ratios['price_performance_6m'] = (end_price - start_price) / start_price if start_price else None
-                
-                # 1-year price performance
-                start_price = historical_data['Close'].iloc[0] if len(historical_data) > 0 else None
-                end_price = historical_data['Close'].iloc[-1] if len(historical_data) > 0 else None
-                ratios['price_performance_1y'] = (end_price - start_price) / start_price if start_price else None
+            # Price performance metrics, computed once per StockData and shared by every analysis
+            if stock_data.close_arr is not None:
+                ratios['price_performance_6m'] = stock_data.returns_6m
+                ratios['price_performance_1y'] = stock_data.returns_1y
                 
-                # Calculate relative strength against the market (S&P 500)
-                if market_data is not None and not market_data.empty:
-                    stock_return = ratios.get('price_performance_1y')
-                    market_start = market_data['Close'].iloc[0] if len(market_data) > 0 else None
-                    market_end = market_data['Close'].iloc[-1] if len(market_data) > 0 else None
-                    market_return = (market_end - market_start) / market_start if market_start else None
-                    
-                    if stock_return is not None and market_return is not None:
-                        ratios['relative_strength'] = stock_return - market_return
+                # Relative strength against the market (S&P 500)
+                if stock_data.relative_strength is not None:
+                    ratios['relative_strength'] = stock_data.relative_strength
             
             # Calculate other growth metrics
-            ratios['revenue_growth'] = info.get('revenueGrowth', None)
-            ratios['earnings_growth'] = info.get('earningsGrowth', None)
-            ratios['eps_growth'] = info.get('earningsQuarterlyGrowth', None)
-            ratios['gross_margin'] = info.get('grossMargins', None)
-            ratios['operating_margin'] = info.get('operatingMargins', None)
-            ratios['analyst_recommendation'] = info.get('recommendationMean', None)
+            for ratio_name, keys, default in _GROWTH_RATIO_KEYS:
+                ratios[ratio_name] = next((info[key] for key in keys if info.get(key) is not None), default)
             
             # Calculate PE to Growth score (custom metric balancing P/E with growth)
             if ratios['pe_ratio'] is not None and ratios['earnings_growth'] is not None and ratios['earnings_growth'] > 0:
@@ -142,16 +163,15 @@ class StockAnalyzer:
             
         # Advanced ratios that might need calculation from statements (for value investing)
         if income_stmt is not None and balance_sheet is not None:
-            # Get the most recent fiscal year data
-            latest_year_income = income_stmt.iloc[:, 0] if not income_stmt.empty else None
-            latest_year_balance = balance_sheet.iloc[:, 0] if not balance_sheet.empty else None
-            
             # Fill in any missing ratios with calculated values
-            if latest_year_income is not None and latest_year_balance is not None:
+            if not income_stmt.empty and not balance_sheet.empty:
+                # The first column holds the most recent fiscal year; read single cells from it
+                latest_year = balance_sheet.columns[0]
+                
                 # Calculate missing ratios if they weren't in info
-                if ratios['current_ratio'] is None and 'TotalCurrentAssets' in latest_year_balance and 'TotalCurrentLiabilities' in latest_year_balance:
-                    curr_assets = latest_year_balance['TotalCurrentAssets']
-                    curr_liab = latest_year_balance['TotalCurrentLiabilities']
+                if ratios['current_ratio'] is None and 'TotalCurrentAssets' in balance_sheet.index and 'TotalCurrentLiabilities' in balance_sheet.index:
+                    curr_assets = balance_sheet.at['TotalCurrentAssets', latest_year]
+                    curr_liab = balance_sheet.at['TotalCurrentLiabilities', latest_year]
                     ratios['current_ratio'] = curr_assets / curr_liab if curr_liab else None
                     
                 # More calculations for missing ratios as needed
@@ -173,9 +193,13 @@ class StockAnalyzer:
         """
         if analysis_type == 'value':
             descriptions = self.value_descriptions
+            short_interpretations = VALUE_SHORT_INTERPRETATIONS
+            great_ranges = VALUE_GREAT_RANGES
             ideal_key = 'value_stock_ideal'
         else:  # growth_momentum
             descriptions = self.growth_momentum_descriptions
+            short_interpretations = GROWTH_MOMENTUM_SHORT_INTERPRETATIONS
+            great_ranges = GROWTH_MOMENTUM_GREAT_RANGES
             ideal_key = 'growth_stock_ideal'
             
         if ratio_name not in descriptions or ratio_value is None:
@@ -183,28 +207,26 @@ class StockAnalyzer:
             
         ratio_info = descriptions[ratio_name]
         
-        # Get the appropriate criteria based on analysis type
-        if analysis_type == 'value':
-            criteria = self.value_criteria[ratio_name]
-        else:  # growth_momentum
-            if ratio_name in self.growth_momentum_criteria:
-                criteria = self.growth_momentum_criteria[ratio_name]
-            else:
-                return "This metric is not applicable for growth/momentum analysis."
+        # Only ratios with rating criteria have an ideal range to compare against
+        if ratio_name not in great_ranges:
+            return f"This metric is not applicable for {analysis_type.replace('_', '/')} analysis."
         
+        # First sentence of the interpretation and the 'great' range are precomputed per ratio
+        interpretation = short_interpretations[ratio_name]
+        great_range = great_ranges[ratio_name]
         explanation = f"{ratio_info['name']} ({ratio_value:.2f}): "
         
         if rating == 'great':
-            explanation += f"EXCELLENT. {ratio_info['interpretation'].split('.')[0]}. "
+            explanation += f"EXCELLENT. {interpretation}. "
             explanation += f"For {analysis_type.replace('_', '/')} stocks, {ratio_info.get(ideal_key, '')}"
         elif rating == 'good':
-            explanation += f"GOOD. {ratio_info['interpretation'].split('.')[0]}. "
-            explanation += f"While not in the ideal range ({criteria['great'][0]:.2f}-{criteria['great'][1] if criteria['great'][1] != float('inf') else 'inf'}), "
+            explanation += f"GOOD. {interpretation}. "
+            explanation += f"While not in the ideal range ({great_range}), "
             explanation += f"it's still acceptable for {analysis_type.replace('_', '/')} investing."
         else:  # no_buy
-            explanation += f"CONCERNING. {ratio_info['interpretation'].split('.')[0]}. "
+            explanation += f"CONCERNING. {interpretation}. "
             explanation += f"For {analysis_type.replace('_', '/')} stocks, this is outside the preferred range. "
-            explanation += f"Ideal would be {criteria['great'][0]:.2f}-{criteria['great'][1] if criteria['great'][1] != float('inf') else 'inf'}."
+            explanation += f"Ideal would be {great_range}."
             
         return explanation
         
@@ -222,26 +244,22 @@ class StockAnalyzer:
         if not ratios:
             return "Insufficient data for classification", {}
             
-        # Set the appropriate criteria based on analysis type
-        if analysis_type == 'value':
-            criteria = self.value_criteria
-        else:  # growth_momentum
-            criteria = self.growth_momentum_criteria
-            
+        # Set the appropriate criteria edges based on analysis type
+        rating_edges = self._rating_edges['value' if analysis_type == 'value' else 'growth_momentum']
+        
         # Count ratings for each category
         rating_counts = {'great': 0, 'good': 0, 'no_buy': 0}
         rating_details = {}
         
-        for ratio_name, ratio_value in ratios.items():
-            if ratio_value is not None and ratio_name in criteria:
-                ratio_criteria = criteria[ratio_name]
-                
-                # Determine rating for this ratio
-                for rating, (min_val, max_val) in ratio_criteria.items():
-                    if min_val <= ratio_value < max_val:
-                        rating_counts[rating] += 1
-                        rating_details[ratio_name] = rating
-                        break
+        # Only visit the ratios that have criteria for this analysis type
+        for ratio_name, (edges, ratings) in rating_edges.items():
+            ratio_value = ratios.get(ratio_name)
+            if ratio_value is not None:
+                # Determine rating for this ratio from the bucket holding its value
+                rating = ratings[bisect.bisect_right(edges, ratio_value)]
+                if rating is not None:
+                    rating_counts[rating] += 1
+                    rating_details[ratio_name] = rating
         
         # Classification logic
         total_rated = sum(rating_counts.values())
@@ -271,30 +289,61 @@ class StockAnalyzer:
             else:
                 return "POOR GROWTH OPPORTUNITY", rating_details
             
-    def generate_report(self, ticker, analysis_type='value'):
+    def classify_batch(self, ratio_name, values, analysis_type='value'):
+        """
+        Rate many values of one ratio at once, e.g. the same ratio across a portfolio.
+        
+        Args:
+            ratio_name (str): Name of the ratio being rated
+            values (array-like): Ratio values, with NaN (or None) where missing
+            analysis_type (str): 'value' or 'growth_momentum'
+        
+        Returns:
+            np.ndarray: Rating per value ('great', 'good', 'no_buy'), or 'N/A' where
+                the value is missing or outside every rating range
+        """
+        values = np.asarray(values, dtype=float)
+        rating_edges = self._rating_edges['value' if analysis_type == 'value' else 'growth_momentum']
+        if ratio_name not in rating_edges:
+            return np.full(values.shape, 'N/A', dtype=object)
+        
+        # Same buckets as classify_stock; NaN sorts past every edge into the unrated last bucket
+        edges, ratings = rating_edges[ratio_name]
+        labels = np.array([rating or 'N/A' for rating in ratings], dtype=object)
+        return labels[np.searchsorted(edges, values, side='right')]
+    
+    def generate_report(self, ticker, analysis_type='value', timestamp=None):
         """
         Generate comprehensive stock analysis report based on analysis type.
         
         Args:
             ticker (str): Stock ticker symbol
             analysis_type (str): 'value' or 'growth_momentum'
+            timestamp (str, optional): Analysis time to record. Defaults to now.
             
         Returns:
             StockReport: Report object or str if error
         """
         # Fetch data
         stock_data = fetch_stock_data(ticker)
+        return self.generate_report_from_data(stock_data, ticker, analysis_type, timestamp)
+    
+    def generate_report_from_data(self, stock_data, ticker, analysis_type='value', timestamp=None):
+        """
+        Generate a stock analysis report from already fetched data.
+        
+        Args:
+            stock_data (StockData): Data for the ticker, e.g. from batch_fetch
+            ticker (str): Stock ticker symbol
+            analysis_type (str): 'value' or 'growth_momentum'
+            timestamp (str, optional): Analysis time to record. Defaults to now.
+        
+        Returns:
+            StockReport: Report object or str if error
+        """
         if not stock_data:
             return f"Could not retrieve data for {ticker}"
             
-        # Set the appropriate criteria and descriptions based on analysis type
-        if analysis_type == 'value':
-            self.classification_criteria = self.value_criteria
-            self.ratio_descriptions = self.value_descriptions
-        else:  # growth_momentum
-            self.classification_criteria = self.growth_momentum_criteria
-            self.ratio_descriptions = self.growth_momentum_descriptions
-            
         # Calculate ratios
         ratios = self.calculate_ratios(stock_data, analysis_type)
         if not ratios:
@@ -317,7 +366,7 @@ class StockAnalyzer:
             company_name=stock_data.info.get('longName', ticker),
             current_price=stock_data.current_price,
             currency=stock_data.info.get('currency', 'USD'),
-            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            timestamp=timestamp or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             classification=classification,
             ratios=ratios,
             rating_details=rating_details,
@@ -327,16 +376,21 @@ class StockAnalyzer:
         
         return report
         
-    def analyze_multiple_stocks(self, tickers, analysis_type='value'):
+    def analyze_multiple_stocks(self, tickers, analysis_type='value', max_workers=8, all_stock_data=None,
+                                timestamp=None):
         """
         Analyze multiple stocks and categorize them based on analysis type.
         
         Args:
             tickers (list): List of stock ticker symbols
             analysis_type (str): 'value' or 'growth_momentum'
+            max_workers (int): Number of threads used to fetch data concurrently
+            all_stock_data (dict, optional): Pre-fetched StockData by ticker, as returned by batch_fetch
+            timestamp (str, optional): Analysis time shared by all reports. Defaults to now.
             
         Returns:
-            tuple: (results, all_reports)
+            tuple: (results, all_reports, errors) where all_reports maps tickers to
+                StockReports and errors maps tickers to error messages
         """
         results = {}
         
@@ -357,41 +411,61 @@ class StockAnalyzer:
             }
         
         all_reports = {}
+        errors = {}
+        
+        # Analyze repeated tickers only once
+        tickers = list(dict.fromkeys(tickers))
+        
+        # Fetch all tickers up front so price histories are downloaded in batches
+        if all_stock_data is None:
+            all_stock_data = batch_fetch(tickers, max_workers=max_workers)
+        
+        # The batch is one analysis, so every report shares the same timestamp
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # Process each ticker
         for ticker in tickers:
             print(f"Analyzing {ticker} ({analysis_type.replace('_', '/')} perspective)...")
-            report = self.generate_report(ticker, analysis_type)
+            report = self.generate_report_from_data(all_stock_data.get(ticker), ticker, analysis_type, timestamp)
             
             if isinstance(report, str):
                 # Error occurred
+                warnings.warn(f"{ticker}: {report}")
                 results['ERROR'].append(ticker)
-                all_reports[ticker] = report
+                errors[ticker] = report
             else:
                 # Successfully analyzed
                 classification = report.classification
                 results[classification].append(ticker)
                 all_reports[ticker] = report
                 
+        # Count great and good indicators for every report at once (one row per ticker)
+        metric_index, edges, codes = self._rating_tables['value' if analysis_type == 'value' else 'growth_momentum']
+        values = np.array(
+            [[report.ratios.get(ratio_name) for ratio_name in metric_index] for report in all_reports.values()],
+            dtype=float
+        ).reshape(len(all_reports), len(metric_index))
+        counts = pd.DataFrame(count_ratings(values, edges, codes), index=list(all_reports), columns=RATINGS)
+        positive = counts['great'] + counts['good']
+        total = counts.sum(axis=1)
+        strength = (positive.astype(str) + "/" + total.astype(str)
+                    + " (" + (positive / total * 100).map("{:.1f}%)".format))
+        
         # Create summary table
         summary_data = []
-        for ticker, report in all_reports.items():
-            if isinstance(report, str):
-                summary_data.append([ticker, "ERROR", report, "-"])
+        for ticker in tickers:
+            if ticker in errors:
+                summary_data.append([ticker, "ERROR", errors[ticker], "-"])
             else:
-                # Count great and good indicators
-                ratings = report.rating_details.values()
-                great_count = list(ratings).count('great')
-                good_count = list(ratings).count('good')
-                total = len(ratings)
-                
-                strength = f"{great_count + good_count}/{total} ({(great_count + good_count)/total*100:.1f}%)"
-                summary_data.append([ticker, report.classification, report.current_price, strength])
+                report = all_reports[ticker]
+                summary_data.append([ticker, report.classification, report.current_price, strength[ticker]])
         
         # Display summary
         print("\n" + "="*80)
         print(f"MULTIPLE STOCK ANALYSIS SUMMARY ({analysis_type.replace('_', '/').upper()} PERSPECTIVE)")
         print("="*80)
+        from tabulate import tabulate
         print(tabulate(summary_data, headers=["Ticker", "Classification", "Price/Error", "Strength"], tablefmt="grid"))
         print("\n")
         
@@ -407,7 +481,7 @@ class StockAnalyzer:
                 else:
                     print(f"🔴 {category} ({len(tickers)}): {', '.join(tickers)}")
         
-        return results, all_reports
+        return results, all_reports, errors
     
     def generate_detailed_comparison(self, all_reports, analysis_type='value'):
         """
@@ -427,64 +501,78 @@ class StockAnalyzer:
         if not valid_reports:
             return f"No valid reports for {analysis_type} analysis to compare."
             
-        # Prepare comparison data
-        comparison_data = []
-        
         # Define the metrics to compare based on analysis type
         if analysis_type == 'value':
             metrics = list(self.value_criteria.keys())
+            descriptions = self.value_descriptions
         else:  # growth_momentum
             metrics = list(self.growth_momentum_criteria.keys())
+            descriptions = self.growth_momentum_descriptions
         
-        # Create header row
-        header_row = ["Metric"]
-        header_row.extend([f"{report.company_name} ({ticker})" for ticker, report in valid_reports.items()])
-        
-        # Add data for each metric
-        for metric in metrics:
-            # Get the appropriate name for the metric based on analysis type
-            if analysis_type == 'value':
-                metric_name = self.value_descriptions.get(metric, {}).get('name', metric.replace('_', ' ').title())
-            else:  # growth_momentum
-                metric_name = self.growth_momentum_descriptions.get(metric, {}).get('name', metric.replace('_', ' ').title())
-                
-            row = [metric_name]
-            
-            for ticker, report in valid_reports.items():
-                value = report.ratios.get(metric)
-                rating = report.rating_details.get(metric, 'N/A')
-                
-                if value is not None:
-                    if rating == 'great':
-                        formatted_value = f"**{value:.2f}** (Great)"
-                    elif rating == 'good':
-                        formatted_value = f"*{value:.2f}* (Good)"
-                    else:
-                        formatted_value = f"{value:.2f} (Poor)"
-                else:
-                    formatted_value = "N/A"
-                    
-                row.append(formatted_value)
-                
-            comparison_data.append(row)
-            
-        # Add classification row
-        classification_row = ["**Classification**"]
-        for ticker, report in valid_reports.items():
-            classification_row.append(f"**{report.classification}**")
-            
-        comparison_data.append(classification_row)
+        # Ratio values and ratings as (metric x ticker) frames
+        values = pd.DataFrame(
+            {ticker: pd.Series(report.ratios, dtype=float) for ticker, report in valid_reports.items()}
+        ).reindex(index=metrics, columns=list(valid_reports))
+        ratings = pd.DataFrame(
+            {ticker: pd.Series(report.rating_details, dtype=object) for ticker, report in valid_reports.items()}
+        ).reindex(index=metrics, columns=list(valid_reports))
+        
+        # Format every cell at once, then pick the label for each cell's rating
+        numbers = values.apply(lambda column: column.map("{:.2f}".format)).to_numpy()
+        rating_codes = ratings.to_numpy()
+        formatted = np.select(
+            [values.isna().to_numpy(), rating_codes == 'great', rating_codes == 'good'],
+            ["N/A", "**" + numbers + "** (Great)", "*" + numbers + "* (Good)"],
+            default=numbers + " (Poor)"
+        )
+        
+        # Assemble the table with one row per metric plus the classification row
+        classifications = [f"**{report.classification}**" for report in valid_reports.values()]
+        row_names = [descriptions.get(metric, {}).get('name', metric.replace('_', ' ').title()) for metric in metrics]
+        comparison = pd.DataFrame(
+            np.vstack([formatted, classifications]),
+            index=pd.Index(row_names + ["**Classification**"], name="Metric"),
+            columns=[f"{report.company_name} ({ticker})" for ticker, report in valid_reports.items()]
+        )
         
         # Generate the comparison table
-        comparison_table = tabulate(comparison_data, headers=header_row, tablefmt="pipe")
+        comparison_table = comparison.to_markdown(tablefmt="pipe")
         
-        # Display as Markdown
+        # Display as Markdown (IPython is only imported when a comparison is shown)
+        from IPython.display import display, Markdown
         display(Markdown(f"## {analysis_type.replace('_', ' & ').title()} Stock Comparison"))
         display(Markdown(comparison_table))
         
         return comparison_table
 
 
+@functools.lru_cache(maxsize=None)
+def _get_analyzer():
+    """Return the StockAnalyzer shared by the module-level helpers (it holds no per-analysis state)."""
+    return StockAnalyzer()
+
+
+@memory_cache(maxsize=512)
+@disk_cache()
+def get_report(ticker, analysis_type='value'):
+    """
+    Generate a report for a single stock, reusing today's cached copy if available.
+    
+    Reports are memoized in-process and cached on disk by (ticker, analysis_type,
+    date), so repeated analyses of the same stock skip fetching and scoring.
+    Error messages are never cached, so a failed analysis is retried next time.
+    Call `get_report.cache_clear()` to drop the in-process copies.
+    
+    Args:
+        ticker (str): Stock ticker symbol
+        analysis_type (str): 'value' or 'growth_momentum'
+    
+    Returns:
+        StockReport: Report object or str if error
+    """
+    return _get_analyzer().generate_report(ticker, analysis_type)
+
+
 def analyze_stock(ticker, analysis_type='value'):
     """
     Analyze a single stock and display the report.
@@ -497,7 +585,7 @@ def analyze_stock(ticker, analysis_type='value'):
         StockReport: Analysis report
     """
     try:
-        analyzer = StockAnalyzer()
+        analyzer = _get_analyzer()
         
         # Test connection first
         if not analyzer.test_connection():
@@ -505,7 +593,7 @@ def analyze_stock(ticker, analysis_type='value'):
             return None
             
         # Get report
-        report = analyzer.generate_report(ticker, analysis_type)
+        report = get_report(ticker, analysis_type)
         
         if isinstance(report, str):
             print(f"Error: {report}")
@@ -521,81 +609,90 @@ def analyze_stock(ticker, analysis_type='value'):
         return None
 
 
-def analyze_multiple(tickers, analysis_type='value'):
+def analyze_multiple(tickers, analysis_type='value', max_workers=8, show_comparison=False):
     """
     Analyze multiple stocks and display categorized results.
     
     Args:
         tickers (list or str): List of stock ticker symbols or comma-separated string
         analysis_type (str): 'value' or 'growth_momentum'
+        max_workers (int): Number of threads used to fetch data concurrently
+        show_comparison (bool): Whether to display a detailed comparison of the reports
         
     Returns:
-        tuple: (categorized results, full reports)
+        tuple: (categorized results, successful reports, error messages by ticker)
     """
     if isinstance(tickers, str):
         tickers = [ticker.strip() for ticker in tickers.split(',')]
     
-    analyzer = StockAnalyzer()
-    results, reports = analyzer.analyze_multiple_stocks(tickers, analysis_type)
+    analyzer = _get_analyzer()
+    results, reports, errors = analyzer.analyze_multiple_stocks(tickers, analysis_type, max_workers)
     
-    # Ask if user wants detailed comparison
-    if len(reports) > 1:
-        print("\nWould you like to see a detailed comparison? (y/n)")
-        response = input()
-        if response.lower() == 'y':
-            analyzer.generate_detailed_comparison(reports, analysis_type)
+    # Show a detailed comparison if requested
+    if show_comparison and len(reports) > 1:
+        analyzer.generate_detailed_comparison(reports, analysis_type)
     
-    return results, reports
+    return results, reports, errors
 
 
-def dual_analysis(tickers):
+def dual_analysis(tickers, max_workers=8, show_comparison=False):
     """
     Analyze stocks from both value and growth+momentum perspectives.
     
     Args:
         tickers (list or str): List of stock ticker symbols or comma-separated string
+        max_workers (int): Number of threads used to fetch data concurrently
+        show_comparison (bool): Whether to display detailed comparisons for both analysis types
         
     Returns:
-        dict: Reports for both analysis types
+        dict: 'results', 'reports' and 'errors' for both analysis types
     """
     if isinstance(tickers, str):
         tickers = [ticker.strip() for ticker in tickers.split(',')]
     
-    analyzer = StockAnalyzer()
+    # Analyze repeated tickers only once
+    tickers = list(dict.fromkeys(tickers))
+    
+    analyzer = _get_analyzer()
+    
+    # Fetch once and score the same data from both perspectives, as one timestamped analysis
+    all_stock_data = batch_fetch(tickers, max_workers=max_workers)
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     # Analyze from value perspective
     print("="*80)
     print("VALUE INVESTING ANALYSIS")
     print("="*80)
-    value_results, value_reports = analyzer.analyze_multiple_stocks(tickers, 'value')
+    value_results, value_reports, value_errors = analyzer.analyze_multiple_stocks(
+        tickers, 'value', max_workers, all_stock_data, timestamp)
     
     # Analyze from growth+momentum perspective
     print("\n" + "="*80)
     print("GROWTH & MOMENTUM INVESTING ANALYSIS")
     print("="*80)
-    growth_results, growth_reports = analyzer.analyze_multiple_stocks(tickers, 'growth_momentum')
+    growth_results, growth_reports, growth_errors = analyzer.analyze_multiple_stocks(
+        tickers, 'growth_momentum', max_workers, all_stock_data, timestamp)
     
     # Prepare combined report
     dual_report = {
         'value_analysis': {
             'results': value_results,
-            'reports': value_reports
+            'reports': value_reports,
+            'errors': value_errors
         },
         'growth_momentum_analysis': {
             'results': growth_results, 
-            'reports': growth_reports
+            'reports': growth_reports,
+            'errors': growth_errors
         }
     }
     
-    # Ask if user wants detailed comparisons
-    if len(tickers) > 1:
-        print("\nWould you like to see detailed comparisons? (y/n)")
-        response = input()
-        if response.lower() == 'y':
-            print("\nValue Investing Comparison:")
-            analyzer.generate_detailed_comparison(value_reports, 'value')
-            print("\nGrowth & Momentum Investing Comparison:")
-            analyzer.generate_detailed_comparison(growth_reports, 'growth_momentum')
+    # Show detailed comparisons if requested
+    if show_comparison and len(tickers) > 1:
+        print("\nValue Investing Comparison:")
+        analyzer.generate_detailed_comparison(value_reports, 'value')
+        print("\nGrowth & Momentum Investing Comparison:")
+        analyzer.generate_detailed_comparison(growth_reports, 'growth_momentum')
     
     # Generate a summary of the dual analysis
     print("\n" + "="*80)
@@ -611,13 +708,13 @@ def dual_analysis(tickers):
         value_class = "ERROR"
         growth_class = "ERROR"
         
-        if not isinstance(value_report, str):
+        if value_report is not None:
             try:
                 value_class = value_report.classification
             except (KeyError, TypeError, AttributeError):
                 value_class = "ERROR (Invalid Report)"
                 
-        if not isinstance(growth_report, str):
+        if growth_report is not None:
             try:
                 growth_class = growth_report.classification
             except (KeyError, TypeError, AttributeError):
@@ -647,6 +744,7 @@ def dual_analysis(tickers):
             overall
         ])
     
+    from tabulate import tabulate
     print(tabulate(summary_data, headers=["Ticker", "Value Rating", "Growth Rating", "Overall"], tablefmt="grid"))
     
     return dual_report
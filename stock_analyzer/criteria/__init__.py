@@ -2,12 +2,38 @@
 Criteria package for stock analyzer.
 """
 
-from stock_analyzer.criteria.value_criteria import VALUE_CRITERIA, VALUE_DESCRIPTIONS
-from stock_analyzer.criteria.growth_criteria import GROWTH_MOMENTUM_CRITERIA, GROWTH_MOMENTUM_DESCRIPTIONS
+from stock_analyzer.criteria.tables import RATINGS
+from stock_analyzer.criteria.value_criteria import (
+    VALUE_CRITERIA, VALUE_DESCRIPTIONS, VALUE_CRITERIA_TEXT, VALUE_CRITERIA_HTML,
+    VALUE_METRIC_INDEX, VALUE_MINS, VALUE_MAXS, VALUE_CRITERIA_DF,
+    VALUE_SHORT_INTERPRETATIONS, VALUE_GREAT_RANGES
+)
+from stock_analyzer.criteria.growth_criteria import (
+    GROWTH_MOMENTUM_CRITERIA, GROWTH_MOMENTUM_DESCRIPTIONS, GROWTH_MOMENTUM_CRITERIA_TEXT, GROWTH_MOMENTUM_CRITERIA_HTML,
+    GROWTH_MOMENTUM_METRIC_INDEX, GROWTH_MOMENTUM_MINS, GROWTH_MOMENTUM_MAXS, GROWTH_MOMENTUM_CRITERIA_DF,
+    GROWTH_MOMENTUM_SHORT_INTERPRETATIONS, GROWTH_MOMENTUM_GREAT_RANGES
+)
 
 __all__ = [
     'VALUE_CRITERIA', 
     'VALUE_DESCRIPTIONS',
     'GROWTH_MOMENTUM_CRITERIA', 
-    'GROWTH_MOMENTUM_DESCRIPTIONS'
+    'GROWTH_MOMENTUM_DESCRIPTIONS',
+    'VALUE_CRITERIA_TEXT',
+    'GROWTH_MOMENTUM_CRITERIA_TEXT',
+    'RATINGS',
+    'VALUE_METRIC_INDEX',
+    'VALUE_MINS',
+    'VALUE_MAXS',
+    'GROWTH_MOMENTUM_METRIC_INDEX',
+    'GROWTH_MOMENTUM_MINS',
+    'GROWTH_MOMENTUM_MAXS',
+    'VALUE_SHORT_INTERPRETATIONS',
+    'VALUE_GREAT_RANGES',
+    'GROWTH_MOMENTUM_SHORT_INTERPRETATIONS',
+    'GROWTH_MOMENTUM_GREAT_RANGES',
+    'VALUE_CRITERIA_HTML',
+    'GROWTH_MOMENTUM_CRITERIA_HTML',
+    'VALUE_CRITERIA_DF',
+    'GROWTH_MOMENTUM_CRITERIA_DF'
 ]
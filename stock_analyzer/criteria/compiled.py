@@ -0,0 +1,65 @@
+"""
+Batch rating counts for classifying many stocks at once.
+
+The bucket lookup is compiled with numba when it is installed; otherwise an
+equivalent vectorized NumPy implementation is used. numba is only imported on
+the first call, so importing the analyzer stays fast.
+"""
+
+import functools
+
+import numpy as np
+
+from stock_analyzer.criteria.tables import RATINGS
+
+
+def _count_ratings_loop(values, edges, codes, n_ratings):
+    """Count ratings per row with explicit loops (compiled by numba when available)."""
+    counts = np.zeros((values.shape[0], n_ratings), dtype=np.int64)
+    for row in range(values.shape[0]):
+        for ratio in range(values.shape[1]):
+            value = values[row, ratio]
+            # Bucket is the number of edges <= value; NaN values and padding never compare true
+            bucket = 0
+            for edge in range(edges.shape[1]):
+                if value >= edges[ratio, edge]:
+                    bucket += 1
+            code = codes[ratio, bucket]
+            if code >= 0:
+                counts[row, code] += 1
+    return counts
+
+
+def _count_ratings_numpy(values, edges, codes, n_ratings):
+    """Count ratings per row with NumPy broadcasting."""
+    buckets = (values[:, :, None] >= edges[None, :, :]).sum(axis=2)
+    rating_codes = codes[np.arange(values.shape[1]), buckets]
+    return (rating_codes[:, :, None] == np.arange(n_ratings)).sum(axis=1)
+
+
+@functools.lru_cache(maxsize=None)
+def _count_ratings_impl():
+    """Return the numba-compiled rating counter, or the NumPy one if numba is not installed."""
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional
+        return _count_ratings_numpy
+    return njit(cache=True)(_count_ratings_loop)
+
+
+def count_ratings(values, edges, codes):
+    """
+    Count great/good/no_buy ratings for many sets of ratios at once.
+    
+    Args:
+        values (np.ndarray): (stocks x ratios) float array, NaN where a ratio is missing
+        edges (np.ndarray): Bucket edges from build_rating_table
+        codes (np.ndarray): Bucket rating codes from build_rating_table
+    
+    Returns:
+        np.ndarray: (stocks x len(RATINGS)) int array of rating counts
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if values.shape[0] == 0:
+        return np.zeros((0, len(RATINGS)), dtype=np.int64)
+    return _count_ratings_impl()(values, edges, codes, len(RATINGS))
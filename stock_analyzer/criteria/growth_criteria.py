@@ -7,8 +7,14 @@ ideal ranges for various financial and momentum metrics according
 to growth investing principles.
 """
 
-# Growth and momentum investing classification criteria
-GROWTH_MOMENTUM_CRITERIA = {
+from stock_analyzer.criteria.tables import (
+    read_only, build_criteria_text, build_criteria_html, build_criteria_bounds,
+    build_criteria_frame, build_short_interpretations, build_great_ranges
+)
+
+
+# Growth and momentum investing classification criteria (read-only)
+GROWTH_MOMENTUM_CRITERIA = read_only({
     'revenue_growth': {'great': (0.2, float('inf')), 'good': (0.1, 0.2), 'no_buy': (0, 0.1)},
     'earnings_growth': {'great': (0.2, float('inf')), 'good': (0.1, 0.2), 'no_buy': (0, 0.1)},
     'price_performance_6m': {'great': (0.15, float('inf')), 'good': (0.05, 0.15), 'no_buy': (-float('inf'), 0.05)},
@@ -19,10 +25,10 @@ GROWTH_MOMENTUM_CRITERIA = {
     'relative_strength': {'great': (0.1, float('inf')), 'good': (0, 0.1), 'no_buy': (-float('inf'), 0)},
     'analyst_recommendation': {'great': (1, 2.5), 'good': (2.5, 3.5), 'no_buy': (3.5, 5)},
     'pe_growth': {'great': (0.8, float('inf')), 'good': (0.5, 0.8), 'no_buy': (0, 0.5)},
-}
+})
 
-# Growth and momentum investing ratio descriptions
-GROWTH_MOMENTUM_DESCRIPTIONS = {
+# Growth and momentum investing ratio descriptions (read-only)
+GROWTH_MOMENTUM_DESCRIPTIONS = read_only({
     'revenue_growth': {
         'name': 'Revenue Growth Rate',
         'description': 'Year-over-year percentage increase in company revenue.',
@@ -83,4 +89,20 @@ GROWTH_MOMENTUM_DESCRIPTIONS = {
         'interpretation': 'Higher is better for growth stocks. This metric rewards high growth even with elevated P/E ratios.',
         'growth_stock_ideal': 'Above 0.8 suggests good balance of growth and valuation.'
     }
-}
+})
+
+# Printable rating ranges for each ratio, formatted once at import
+GROWTH_MOMENTUM_CRITERIA_TEXT = build_criteria_text(GROWTH_MOMENTUM_CRITERIA)
+
+# Rating ranges as report HTML, rendered once at import
+GROWTH_MOMENTUM_CRITERIA_HTML = build_criteria_html(GROWTH_MOMENTUM_CRITERIA)
+
+# Rating bounds as (ratio x rating) arrays; rows follow GROWTH_MOMENTUM_METRIC_INDEX, columns follow RATINGS
+GROWTH_MOMENTUM_METRIC_INDEX, GROWTH_MOMENTUM_MINS, GROWTH_MOMENTUM_MAXS = build_criteria_bounds(GROWTH_MOMENTUM_CRITERIA)
+
+# The same bounds as a DataFrame with one row per ratio and <rating>_lo/<rating>_hi columns
+GROWTH_MOMENTUM_CRITERIA_DF = build_criteria_frame(GROWTH_MOMENTUM_CRITERIA)
+
+# Text pieces used by rating explanations, derived once at import
+GROWTH_MOMENTUM_SHORT_INTERPRETATIONS = build_short_interpretations(GROWTH_MOMENTUM_DESCRIPTIONS)
+GROWTH_MOMENTUM_GREAT_RANGES = build_great_ranges(GROWTH_MOMENTUM_CRITERIA)
@@ -0,0 +1,226 @@
+"""
+Lookup tables derived from the investing criteria.
+
+The criteria dictionaries are static, so anything derived from them
+(formatted text, lookup arrays) is built once when the criteria modules
+are imported rather than every time it is used.
+"""
+
+import math
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+
+# Column order of the rating bound arrays
+RATINGS = ('great', 'good', 'no_buy')
+
+
+def read_only(mapping):
+    """
+    Wrap a mapping of mappings in read-only views, including the inner mappings.
+    
+    Args:
+        mapping (dict): Mapping whose values are dicts, e.g. criteria or descriptions
+    
+    Returns:
+        MappingProxyType: Read-only view whose values are read-only views too
+    """
+    return MappingProxyType({key: MappingProxyType(value) for key, value in mapping.items()})
+
+
+def format_bound(value, negative_inf="-infinity", positive_inf="infinity"):
+    """
+    Format a criteria bound with two decimals, spelling out infinities.
+    
+    Args:
+        value (float): Lower or upper bound of a rating range
+        negative_inf (str): Text used for -inf
+        positive_inf (str): Text used for inf
+    
+    Returns:
+        str: Formatted bound
+    """
+    if math.isfinite(value):
+        return f"{value:.2f}"
+    return negative_inf if value < 0 else positive_inf
+
+
+def build_criteria_text(criteria):
+    """
+    Format each ratio's rating ranges as printable lines.
+    
+    Args:
+        criteria (dict): Criteria mapping ratio name -> rating -> (min, max)
+    
+    Returns:
+        dict: Ratio name -> newline-joined "    - RATING: min to max" lines
+    """
+    return {
+        ratio_name: "\n".join(
+            f"    - {rating.upper()}: {format_bound(min_val)} to {format_bound(max_val)}"
+            for rating, (min_val, max_val) in ratio_criteria.items()
+        )
+        for ratio_name, ratio_criteria in criteria.items()
+    }
+
+
+def build_criteria_html(criteria):
+    """
+    Render each ratio's rating ranges as the HTML list used in reports.
+    
+    Args:
+        criteria (dict): Criteria mapping ratio name -> rating -> (min, max)
+    
+    Returns:
+        dict: Ratio name -> "Rating criteria" heading and color-coded <ul> list
+    """
+    colors = {'great': 'green', 'good': 'blue'}
+    return {
+        ratio_name: "<p><strong>Rating criteria:</strong></p><ul>" + "".join(
+            f"<li><span style='color:{colors.get(rating, 'red')};'>{rating.upper()}</span>: "
+            f"{format_bound(min_val, '-∞', '∞')} to {format_bound(max_val, '-∞', '∞')}</li>"
+            for rating, (min_val, max_val) in ratio_criteria.items()
+        ) + "</ul>"
+        for ratio_name, ratio_criteria in criteria.items()
+        if ratio_criteria
+    }
+
+
+def build_short_interpretations(descriptions):
+    """
+    Take the first sentence of each ratio's interpretation.
+    
+    Args:
+        descriptions (dict): Descriptions mapping ratio name -> info dict
+    
+    Returns:
+        dict: Ratio name -> first sentence of its interpretation (without the period)
+    """
+    return {
+        ratio_name: ratio_info['interpretation'].split('.')[0]
+        for ratio_name, ratio_info in descriptions.items()
+    }
+
+
+def build_great_ranges(criteria):
+    """
+    Format each ratio's 'great' range as used in rating explanations.
+    
+    Args:
+        criteria (dict): Criteria mapping ratio name -> rating -> (min, max)
+    
+    Returns:
+        dict: Ratio name -> "min-max" text, e.g. "0.00-15" or "0.15-inf"
+    """
+    return {
+        ratio_name: f"{min_val:.2f}-{max_val if max_val != float('inf') else 'inf'}"
+        for ratio_name, (min_val, max_val) in ((name, ratio_criteria['great']) for name, ratio_criteria in criteria.items())
+    }
+
+
+def build_criteria_bounds(criteria):
+    """
+    Convert criteria into lower and upper bound arrays for vectorized lookups.
+    
+    Args:
+        criteria (dict): Criteria mapping ratio name -> rating -> (min, max)
+    
+    Returns:
+        tuple: (metric_index, mins, maxs) where metric_index maps ratio name to
+            row number and mins/maxs are (ratios x RATINGS) float arrays
+    """
+    metric_index = {ratio_name: row for row, ratio_name in enumerate(criteria)}
+    bounds = np.array(
+        [[criteria[ratio_name][rating] for rating in RATINGS] for ratio_name in criteria],
+        dtype=float
+    )
+    return metric_index, bounds[:, :, 0], bounds[:, :, 1]
+
+
+def build_criteria_frame(criteria):
+    """
+    Lay the criteria out as one table row per ratio for column-wise comparisons.
+    
+    Args:
+        criteria (dict): Criteria mapping ratio name -> rating -> (min, max)
+    
+    Returns:
+        pd.DataFrame: Indexed by ratio name, with great_lo, great_hi, good_lo,
+            good_hi, no_buy_lo and no_buy_hi columns
+    """
+    metric_index, mins, maxs = build_criteria_bounds(criteria)
+    columns = {}
+    for column, rating in enumerate(RATINGS):
+        columns[f"{rating}_lo"] = mins[:, column]
+        columns[f"{rating}_hi"] = maxs[:, column]
+    return pd.DataFrame(columns, index=pd.Index(list(metric_index), name='ratio'))
+
+
+def _rating_buckets(ratio_criteria):
+    """
+    Flatten one ratio's rating ranges into sorted edges and per-bucket ratings.
+    
+    Bucket i covers [edges[i - 1], edges[i]), so bisect_right(edges, value) is the
+    bucket holding a value. Each bucket is labelled with the first rating whose
+    [min, max) range covers it, or None where no rating applies.
+    
+    Args:
+        ratio_criteria (dict): Rating -> (min, max) for a single ratio
+    
+    Returns:
+        tuple: (edges, ratings) lists, with one more rating than edges
+    """
+    edges = sorted({bound for bounds in ratio_criteria.values() for bound in bounds})
+    ratings = [None] * (len(edges) + 1)
+    for bucket, (lower, upper) in enumerate(zip(edges, edges[1:]), start=1):
+        ratings[bucket] = next(
+            (rating for rating, (min_val, max_val) in ratio_criteria.items()
+             if min_val <= lower and upper <= max_val),
+            None
+        )
+    return edges, ratings
+
+
+def build_rating_edges(criteria):
+    """
+    Convert criteria into sorted bucket edges for bisect lookups.
+    
+    Args:
+        criteria (dict): Criteria mapping ratio name -> rating -> (min, max)
+    
+    Returns:
+        dict: Ratio name -> (edges, ratings) as described in _rating_buckets
+    """
+    return {ratio_name: _rating_buckets(ratio_criteria) for ratio_name, ratio_criteria in criteria.items()}
+
+
+def build_rating_table(criteria):
+    """
+    Convert criteria into bucket edge and rating code arrays for batch classification.
+    
+    Each row holds one ratio's edges and bucket ratings from _rating_buckets, so the
+    bucket holding a value is the number of edges <= value. Ratings are stored as
+    indexes into RATINGS, or -1 where no rating applies.
+    
+    Args:
+        criteria (dict): Criteria mapping ratio name -> rating -> (min, max)
+    
+    Returns:
+        tuple: (metric_index, edges, codes) where metric_index maps ratio name to
+            row number, edges is a (ratios x max_edges) float array padded with NaN
+            and codes is a (ratios x max_edges + 1) int array of rating indexes
+    """
+    metric_index = {ratio_name: row for row, ratio_name in enumerate(criteria)}
+    buckets = [_rating_buckets(ratio_criteria) for ratio_criteria in criteria.values()]
+    width = max((len(edges) for edges, _ in buckets), default=0)
+    
+    # NaN padding never compares <= a value, so it never moves a value into another bucket
+    edges = np.full((len(criteria), width), np.nan)
+    codes = np.full((len(criteria), width + 1), -1, dtype=int)
+    for row, (row_edges, ratings) in enumerate(buckets):
+        edges[row, :len(row_edges)] = row_edges
+        codes[row, :len(ratings)] = [-1 if rating is None else RATINGS.index(rating) for rating in ratings]
+    
+    return metric_index, edges, codes
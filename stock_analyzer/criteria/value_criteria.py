@@ -6,8 +6,14 @@ value-based stock analysis. The criteria represent ideal ranges
 for various financial ratios according to value investing principles.
 """
 
-# Value investing classification criteria
-VALUE_CRITERIA = {
+from stock_analyzer.criteria.tables import (
+    read_only, build_criteria_text, build_criteria_html, build_criteria_bounds,
+    build_criteria_frame, build_short_interpretations, build_great_ranges
+)
+
+
+# Value investing classification criteria (read-only)
+VALUE_CRITERIA = read_only({
     'pe_ratio': {'great': (0, 15), 'good': (15, 25), 'no_buy': (25, float('inf'))},
     'pb_ratio': {'great': (0, 1.5), 'good': (1.5, 3), 'no_buy': (3, float('inf'))},
     'ps_ratio': {'great': (0, 2), 'good': (2, 4), 'no_buy': (4, float('inf'))},
@@ -17,10 +23,10 @@ VALUE_CRITERIA = {
     'dividend_yield': {'great': (0.03, float('inf')), 'good': (0.01, 0.03), 'no_buy': (0, 0.01)},
     'profit_margin': {'great': (0.15, float('inf')), 'good': (0.08, 0.15), 'no_buy': (0, 0.08)},
     'peg_ratio': {'great': (0, 1), 'good': (1, 2), 'no_buy': (2, float('inf'))},
-}
+})
 
-# Value investing ratio descriptions
-VALUE_DESCRIPTIONS = {
+# Value investing ratio descriptions (read-only)
+VALUE_DESCRIPTIONS = read_only({
     'pe_ratio': {
         'name': 'Price-to-Earnings Ratio',
         'description': 'Compares a company\'s share price to its earnings per share.',
@@ -75,4 +81,20 @@ VALUE_DESCRIPTIONS = {
         'interpretation': 'Lower is better. Takes into account growth expectations to give context to the P/E ratio.',
         'value_stock_ideal': 'Below 1.0 suggests the stock may be undervalued relative to its growth rate.'
     }
-}
+})
+
+# Printable rating ranges for each ratio, formatted once at import
+VALUE_CRITERIA_TEXT = build_criteria_text(VALUE_CRITERIA)
+
+# Rating ranges as report HTML, rendered once at import
+VALUE_CRITERIA_HTML = build_criteria_html(VALUE_CRITERIA)
+
+# Rating bounds as (ratio x rating) arrays; rows follow VALUE_METRIC_INDEX, columns follow RATINGS
+VALUE_METRIC_INDEX, VALUE_MINS, VALUE_MAXS = build_criteria_bounds(VALUE_CRITERIA)
+
+# The same bounds as a DataFrame with one row per ratio and <rating>_lo/<rating>_hi columns
+VALUE_CRITERIA_DF = build_criteria_frame(VALUE_CRITERIA)
+
+# Text pieces used by rating explanations, derived once at import
+VALUE_SHORT_INTERPRETATIONS = build_short_interpretations(VALUE_DESCRIPTIONS)
+VALUE_GREAT_RANGES = build_great_ranges(VALUE_CRITERIA)
@@ -2,7 +2,9 @@
 Report model class for stock analyzer.
 """
 
+from collections import Counter
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, Any, Optional
 
 
@@ -34,20 +36,25 @@ class StockReport:
     ratio_explanations: Dict[str, str]
     analysis_type: str = 'value'
     
+    @cached_property
+    def _rating_counts(self) -> Counter:
+        """Count of each rating in the report (computed once; rating_details is not modified after creation)."""
+        return Counter(self.rating_details.values())
+    
     @property
     def great_count(self) -> int:
         """Count of 'great' ratings in the report."""
-        return list(self.rating_details.values()).count('great')
+        return self._rating_counts['great']
     
     @property
     def good_count(self) -> int:
         """Count of 'good' ratings in the report."""
-        return list(self.rating_details.values()).count('good')
+        return self._rating_counts['good']
     
     @property
     def no_buy_count(self) -> int:
         """Count of 'no_buy' ratings in the report."""
-        return list(self.rating_details.values()).count('no_buy')
+        return self._rating_counts['no_buy']
     
     @property
     def total_rated(self) -> int:
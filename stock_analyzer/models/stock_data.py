@@ -2,11 +2,31 @@
 Stock data model classes for the stock analyzer.
 """
 
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, Any, Optional
 
 
+# Info keys holding the latest price, in order of preference
+_PRICE_KEYS = ('currentPrice', 'regularMarketPrice')
+
+
+def _close_prices(prices: Optional[pd.DataFrame]) -> Optional[np.ndarray]:
+    """Return the 'Close' column of a price history as an array, or None if there is no history."""
+    if prices is None or prices.empty:
+        return None
+    return prices['Close'].to_numpy()
+
+
+def _price_return(start_price, end_price) -> Optional[float]:
+    """Return the fractional change from start_price to end_price, or None if start_price is zero."""
+    # Prices may be stored as float32; do the arithmetic in double precision
+    start_price, end_price = float(start_price), float(end_price)
+    return (end_price - start_price) / start_price if start_price else None
+
+
 @dataclass
 class StockData:
     """
@@ -18,8 +38,8 @@ class StockData:
         income_stmt (pd.DataFrame): Income statement data
         balance_sheet (pd.DataFrame): Balance sheet data
         cash_flow (pd.DataFrame): Cash flow statement data
-        historical_data (pd.DataFrame): Historical price data
-        market_data (pd.DataFrame): Market benchmark data
+        historical_data (pd.DataFrame): Historical closing prices
+        market_data (pd.DataFrame): Market benchmark closing prices
         current_price (float): Current stock price
     """
     ticker: str
@@ -34,4 +54,40 @@ class StockData:
     def __post_init__(self):
         """Additional initialization after data class is created."""
         if self.current_price is None and self.info:
-            self.current_price = self.info.get('currentPrice', self.info.get('regularMarketPrice', None))
+            self.current_price = next(
+                (self.info[key] for key in _PRICE_KEYS if self.info.get(key) is not None), None)
+    
+    @cached_property
+    def close_arr(self) -> Optional[np.ndarray]:
+        """Closing prices from historical_data, computed once and shared by every analysis."""
+        return _close_prices(self.historical_data)
+    
+    @cached_property
+    def market_close_arr(self) -> Optional[np.ndarray]:
+        """Closing prices from market_data, computed once and shared by every analysis."""
+        return _close_prices(self.market_data)
+    
+    @cached_property
+    def returns_6m(self) -> Optional[float]:
+        """Price return over the last ~6 months (126 trading days), or None without history."""
+        closes = self.close_arr
+        if closes is None:
+            return None
+        return _price_return(closes[-min(closes.size, 126)], closes[-1])
+    
+    @cached_property
+    def returns_1y(self) -> Optional[float]:
+        """Price return over the whole price history, or None without history."""
+        closes = self.close_arr
+        if closes is None:
+            return None
+        return _price_return(closes[0], closes[-1])
+    
+    @cached_property
+    def relative_strength(self) -> Optional[float]:
+        """1-year return minus the market benchmark's return, or None if either is unavailable."""
+        market_closes = self.market_close_arr
+        if self.returns_1y is None or market_closes is None:
+            return None
+        market_return = _price_return(market_closes[0], market_closes[-1])
+        return None if market_return is None else self.returns_1y - market_return
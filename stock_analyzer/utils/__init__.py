@@ -2,13 +2,21 @@
 Utilities package for stock analyzer.
 """
 
-from stock_analyzer.utils.fetch_utils import fetch_stock_data, fetch_multiple_stocks
-from stock_analyzer.utils.display_utils import print_report, save_report_html, generate_comparison_markdown
+from stock_analyzer.utils.fetch_utils import fetch_stock_data, fetch_multiple_stocks, batch_fetch
+from stock_analyzer.utils.display_utils import (
+    print_report, render_report_html, save_report_html, generate_comparison_markdown
+)
+from stock_analyzer.utils.cache_utils import disk_cache, memory_cache, set_cache_enabled
 
 __all__ = [
     'fetch_stock_data', 
     'fetch_multiple_stocks',
+    'batch_fetch',
     'print_report', 
+    'render_report_html',
     'save_report_html',
-    'generate_comparison_markdown'
+    'generate_comparison_markdown',
+    'disk_cache',
+    'memory_cache',
+    'set_cache_enabled'
 ]
@@ -0,0 +1,202 @@
+"""
+Caching utilities for stock analyzer.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Optional
+
+
+# Default location of the on-disk cache
+DEFAULT_CACHE_DIR = "~/.stock_analyzer_cache"
+
+# Global switch so command-line tools can bypass the cache (e.g. --no-cache)
+_cache_enabled = True
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """
+    Enable or disable the on-disk cache for all decorated functions.
+    
+    Args:
+        enabled (bool): False to always call through to the wrapped functions
+    """
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def _cache_file(cache_dir: str, name: str, args) -> str:
+    """Return the cache file for a call of `name` with `args` made today."""
+    key_parts = [name, *map(str, args), date.today().isoformat()]
+    key = hashlib.sha1("|".join(key_parts).encode()).hexdigest()
+    return os.path.join(os.path.expanduser(cache_dir), f"{key}.pkl")
+
+
+def read_cache(name: str, args, path: str = DEFAULT_CACHE_DIR, ttl: Optional[float] = None):
+    """
+    Look up today's cached result of a call, as stored by disk_cache or write_cache.
+    
+    Args:
+        name (str): Name of the cached function
+        args (tuple): Arguments of the call, including defaults
+        path (str): Directory the cache files are stored in
+        ttl (float, optional): Maximum age of the cached result in seconds
+    
+    Returns:
+        The cached result, or None if there is none (or the cache is disabled)
+    """
+    if not _cache_enabled:
+        return None
+    
+    cache_file = _cache_file(path, name, args)
+    # Cache hit (unless it has outlived the ttl)
+    try:
+        if ttl is None or time.time() - os.path.getmtime(cache_file) < ttl:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable cache file {cache_file}: {str(e)}")
+    return None
+
+
+def write_cache(name: str, args, result, path: str = DEFAULT_CACHE_DIR) -> None:
+    """
+    Store the result of a call so read_cache and disk_cache can reuse it today.
+    
+    Results that are None or a str (error messages) are never cached.
+    
+    Args:
+        name (str): Name of the cached function
+        args (tuple): Arguments of the call, including defaults
+        result: Value returned by the call
+        path (str): Directory to store the cache file in
+    """
+    if not _cache_enabled or result is None or isinstance(result, str):
+        return
+    
+    cache_file = _cache_file(path, name, args)
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        # Write to a temp file first so readers never see a partial pickle
+        fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(result, f)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"Warning: Could not write cache file {cache_file}: {str(e)}")
+
+
+def disk_cache(path: str = DEFAULT_CACHE_DIR, ttl: Optional[float] = None) -> Callable:
+    """
+    Decorator that caches a function's results on disk for the current day.
+    
+    Results are pickled under `path`, keyed by the function name, its
+    arguments and today's date, so cached data is refreshed once per day.
+    Results that are None or a str (error messages) are never cached.
+    
+    Args:
+        path (str): Directory to store cache files in
+        ttl (float, optional): Maximum age of a cached result in seconds, for data
+            that goes stale within the day. If None, results last the whole day.
+    
+    Returns:
+        Callable: Decorator to apply to the function
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _cache_enabled:
+                return func(*args, **kwargs)
+            
+            # Bind arguments so f('AAPL') and f('AAPL', 'value') share a key
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            call_args = tuple(bound.arguments.values())
+            
+            result = read_cache(func.__name__, call_args, path, ttl)
+            if result is not None:
+                return result
+            
+            # Cache miss - compute and write through on success
+            result = func(*args, **kwargs)
+            write_cache(func.__name__, call_args, result, path)
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+def memory_cache(maxsize: int = 512, ttl: Optional[float] = None) -> Callable:
+    """
+    Decorator that memoizes a function's successful results in memory.
+    
+    Works like functools.lru_cache, except that results that are None or a str
+    (error messages) are never stored, so a failed call is retried the next time
+    instead of being returned for the rest of the session. The decorated function
+    gets a cache_clear() method, and the cache is bypassed while
+    set_cache_enabled(False) is in effect.
+    
+    Args:
+        maxsize (int): Maximum number of results kept (least recently used are dropped)
+        ttl (float, optional): Maximum age of a memoized result in seconds. If None,
+            results are kept until they are evicted or cleared.
+    
+    Returns:
+        Callable: Decorator to apply to the function
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        cache = OrderedDict()
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _cache_enabled:
+                return func(*args, **kwargs)
+            
+            # Bind arguments so f('AAPL') and f('AAPL', 'value') share a key
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.values())
+            
+            # Cache hit
+            with lock:
+                if key in cache:
+                    stored_at, result = cache[key]
+                    if ttl is None or time.monotonic() - stored_at < ttl:
+                        cache.move_to_end(key)
+                        return result
+                    del cache[key]
+            
+            # Cache miss - only keep successful results
+            result = func(*args, **kwargs)
+            if result is not None and not isinstance(result, str):
+                with lock:
+                    cache[key] = (time.monotonic(), result)
+                    cache.move_to_end(key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            
+            return result
+        
+        def cache_clear():
+            with lock:
+                cache.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
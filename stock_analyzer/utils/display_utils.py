@@ -2,31 +2,94 @@
 Display utilities for stock analyzer.
 """
 
-from IPython.display import display, HTML, Markdown
 from typing import Union, Dict
 from datetime import datetime
 
 from stock_analyzer.models.report import StockReport
-from stock_analyzer.criteria.value_criteria import VALUE_DESCRIPTIONS, VALUE_CRITERIA
-from stock_analyzer.criteria.growth_criteria import GROWTH_MOMENTUM_DESCRIPTIONS, GROWTH_MOMENTUM_CRITERIA
+from stock_analyzer.criteria.value_criteria import VALUE_DESCRIPTIONS, VALUE_CRITERIA_HTML
+from stock_analyzer.criteria.growth_criteria import GROWTH_MOMENTUM_DESCRIPTIONS, GROWTH_MOMENTUM_CRITERIA_HTML
 
 
-def print_report(report: Union[StockReport, str]) -> str:
+# Page wrapped around a rendered report by save_report_html, split around the report body
+_PAGE_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Stock Analysis: {ticker} - {analysis_type}</title>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+<body>
+"""
+_PAGE_FOOT = """
+</body>
+</html>
+"""
+
+
+# Text color for each rating (ratios without a rating are shown in red too)
+_RATING_COLOR = {'great': 'green', 'good': 'blue', 'no_buy': 'red'}
+
+# Classification banner colors, checked in order against the classification text
+_CLASSIFICATION_BG = {'GREAT': "#4CAF50", 'GOOD': "#2196F3"}  # Green, blue (red otherwise)
+
+# Opening of a detailed ratio explanation; filled in with str.format per ratio
+_EXPLANATION_HEAD = ("<div style='margin-bottom:15px; border-left:4px solid {color}; padding-left:10px;'>"
+                     "<p style='color:{color}; font-weight:bold;'>• {explanation}</p>")
+
+
+def _build_ratio_info(descriptions, criteria_html, analysis_type):
     """
-    Pretty print the stock analysis report with enhanced visuals.
+    Precompute the display name and educational HTML of each ratio for one analysis type.
+    
+    Args:
+        descriptions (dict): Ratio descriptions for the analysis type
+        criteria_html (dict): Rendered rating criteria for the analysis type
+        analysis_type (str): 'value' or 'growth_momentum'
+    
+    Returns:
+        dict: Ratio name -> {'name': display name, 'template': explanation HTML with
+            {color} and {explanation} placeholders left to fill in}
+    """
+    ideal_key = 'value_stock_ideal' if analysis_type == 'value' else 'growth_stock_ideal'
+    return {
+        ratio_name: {
+            'name': ratio_info.get('name', ratio_name.replace('_', ' ').title()),
+            'template': _EXPLANATION_HEAD + "".join([
+                "<div style='margin-left:20px; font-size:0.9em;'>",
+                f"<p><strong>What it means:</strong> {ratio_info.get('description', 'No description available.')}</p>",
+                f"<p><strong>How to interpret:</strong> {ratio_info.get('interpretation', 'No interpretation available.')}</p>",
+                f"<p><strong>Ideal range for {analysis_type.replace('_', '/')} investing:</strong> "
+                f"{ratio_info.get(ideal_key, 'No ideal range specified.')}</p>",
+                criteria_html.get(ratio_name, ""),
+                "</div></div>"
+            ]).replace("{", "{{").replace("}", "}}")  # Keep the static text literal for str.format
+        }
+        for ratio_name, ratio_info in descriptions.items()
+        if ratio_info
+    }
+
+
+# Per-ratio report content for each analysis type, built once at import
+_RATIO_INFO = {
+    'value': _build_ratio_info(VALUE_DESCRIPTIONS, VALUE_CRITERIA_HTML, 'value'),
+    'growth_momentum': _build_ratio_info(GROWTH_MOMENTUM_DESCRIPTIONS, GROWTH_MOMENTUM_CRITERIA_HTML, 'growth_momentum')
+}
+
+
+def render_report_html(report: Union[StockReport, str]) -> str:
+    """
+    Build the HTML for a stock analysis report without displaying it.
     
-    This function takes a StockReport object and generates a rich HTML
-    visualization of the report, with color-coding, formatted tables,
-    and detailed explanations.
+    The HTML is a rich visualization of the report, with color-coding,
+    formatted tables, and detailed explanations.
     
     Args:
         report (Union[StockReport, str]): Report object or error message
         
     Returns:
-        str: HTML content of the report
+        str: HTML content of the report (or the error message unchanged)
     """
     if isinstance(report, str):
-        print(report)
         return report
             
     # Determine analysis type
@@ -45,12 +108,7 @@ def print_report(report: Union[StockReport, str]) -> str:
 """
     
     # Classification section with appropriate color
-    if "GREAT" in report.classification:
-        bgcolor = "#4CAF50"  # Green
-    elif "GOOD" in report.classification:
-        bgcolor = "#2196F3"  # Blue
-    else:
-        bgcolor = "#F44336"  # Red
+    bgcolor = next((color for label, color in _CLASSIFICATION_BG.items() if label in report.classification), "#F44336")
         
     classification_html = f"""
 <div style="background-color:{bgcolor}; color:white; padding:10px; border-radius:10px; margin:10px 0; text-align:center;">
@@ -58,49 +116,28 @@ def print_report(report: Union[StockReport, str]) -> str:
 </div>
 """
     
-    # Ratios table
-    ratios_data = []
+    # Collect the HTML fragments in a list and join them once at the end
+    parts = [header, classification_html]
     
-    # Get the appropriate criteria dictionaries based on analysis type
-    from stock_analyzer.criteria.value_criteria import VALUE_DESCRIPTIONS
-    from stock_analyzer.criteria.growth_criteria import GROWTH_MOMENTUM_DESCRIPTIONS
+    # Names and educational content for this analysis type's ratios
+    ratio_info_table = _RATIO_INFO['value' if analysis_type == 'value' else 'growth_momentum']
     
-    value_descriptions = VALUE_DESCRIPTIONS
-    growth_momentum_descriptions = GROWTH_MOMENTUM_DESCRIPTIONS
+    # Create ratios table HTML, writing each row as soon as it is formatted
+    parts.append(f"<h2>{analysis_type.replace('_', ' & ').upper()} FINANCIAL RATIOS:</h2>")
+    parts.append("<table border='1' style='width:100%; border-collapse:collapse;'>")
+    parts.append("<tr style='background-color:#f2f2f2;'><th>Ratio</th><th>Value</th><th>Rating</th></tr>")
     
     for ratio_name, ratio_value in report.ratios.items():
         if ratio_value is not None and ratio_name in report.rating_details:
             rating = report.rating_details.get(ratio_name, 'N/A')
+            color = _RATING_COLOR.get(rating, 'red')
             
-            # Color for rating
-            if rating == 'great':
-                color = 'green'
-            elif rating == 'good':
-                color = 'blue'
-            else:  # no_buy
-                color = 'red'
-            
-            # Get ratio info from the appropriate description dictionary
-            if analysis_type == 'value':
-                ratio_info = value_descriptions.get(ratio_name, {'name': ratio_name.replace('_', ' ').title()})
-            else:  # growth_momentum
-                ratio_info = growth_momentum_descriptions.get(ratio_name, {'name': ratio_name.replace('_', ' ').title()})
-            
-            ratios_data.append([
-                ratio_info.get('name', ratio_name.replace('_', ' ').title()), 
-                f"{ratio_value:.2f}" if isinstance(ratio_value, (int, float)) else ratio_value,
-                f"<span style='color:{color};'>{rating.upper()}</span>"
-            ])
+            ratio_info = ratio_info_table.get(ratio_name)
+            name = ratio_info['name'] if ratio_info else ratio_name.replace('_', ' ').title()
+            value = f"{ratio_value:.2f}" if isinstance(ratio_value, (int, float)) else ratio_value
+            parts.append(f"<tr><td>{name}</td><td>{value}</td><td><span style='color:{color};'>{rating.upper()}</span></td></tr>")
             
-    # Create ratios table HTML
-    table_html = f"<h2>{analysis_type.replace('_', ' & ').upper()} FINANCIAL RATIOS:</h2>"
-    table_html += "<table border='1' style='width:100%; border-collapse:collapse;'>"
-    table_html += "<tr style='background-color:#f2f2f2;'><th>Ratio</th><th>Value</th><th>Rating</th></tr>"
-    
-    for row in ratios_data:
-        table_html += f"<tr><td>{row[0]}</td><td>{row[1]}</td><td>{row[2]}</td></tr>"
-        
-    table_html += "</table>"
+    parts.append("</table>")
     
     # Summary statistics
     great_count = report.great_count
@@ -108,82 +145,65 @@ def print_report(report: Union[StockReport, str]) -> str:
     no_buy_count = report.no_buy_count
     total = report.total_rated
     
-    summary_html = "<h2>SUMMARY:</h2>"
-    summary_html += "<div style='padding:10px; background-color:#f9f9f9; border-radius:5px;'>"
+    parts.append("<h2>SUMMARY:</h2>")
+    parts.append("<div style='padding:10px; background-color:#f9f9f9; border-radius:5px;'>")
     
     if total > 0:
-        summary_html += f"<p>• <span style='color:green;'>Great indicators</span>: {great_count}/{total} ({great_count/total*100:.1f}%)</p>"
-        summary_html += f"<p>• <span style='color:blue;'>Good indicators</span>: {good_count}/{total} ({good_count/total*100:.1f}%)</p>"
-        summary_html += f"<p>• <span style='color:red;'>Poor indicators</span>: {no_buy_count}/{total} ({no_buy_count/total*100:.1f}%)</p>"
+        parts.append(f"<p>• <span style='color:green;'>Great indicators</span>: {great_count}/{total} ({great_count/total*100:.1f}%)</p>")
+        parts.append(f"<p>• <span style='color:blue;'>Good indicators</span>: {good_count}/{total} ({good_count/total*100:.1f}%)</p>")
+        parts.append(f"<p>• <span style='color:red;'>Poor indicators</span>: {no_buy_count}/{total} ({no_buy_count/total*100:.1f}%)</p>")
     
-    summary_html += f"<p><b>{report.summary}</b></p>"
-    summary_html += "</div>"
+    parts.append(f"<p><b>{report.summary}</b></p>")
+    parts.append("</div>")
     
     # Ratio explanations section
-    explanations_html = "<h2>RATIO ANALYSIS:</h2>"
-    explanations_html += "<div style='padding:10px; background-color:#f9f9f9; border-radius:5px;'>"
+    parts.append("<h2>RATIO ANALYSIS:</h2>")
+    parts.append("<div style='padding:10px; background-color:#f9f9f9; border-radius:5px;'>")
     
     for ratio_name, explanation in report.ratio_explanations.items():
-        rating = report.rating_details.get(ratio_name, 'N/A')
-        if rating == 'great':
-            color = 'green'
-        elif rating == 'good':
-            color = 'blue' 
-        else:
-            color = 'red'
-            
-        # Get detailed information about the ratio
-        ratio_info = None
-        if analysis_type == 'value':
-            ratio_info = value_descriptions.get(ratio_name, {})
-        else:  # growth_momentum
-            ratio_info = growth_momentum_descriptions.get(ratio_name, {})
-            
+        color = _RATING_COLOR.get(report.rating_details.get(ratio_name), 'red')
+        
         # Create a more detailed explanation with ratio information
+        ratio_info = ratio_info_table.get(ratio_name)
         if ratio_info:
-            # Start with the colored rating explanation
-            explanations_html += f"<div style='margin-bottom:15px; border-left:4px solid {color}; padding-left:10px;'>"
-            explanations_html += f"<p style='color:{color}; font-weight:bold;'>• {explanation}</p>"
-            
-            # Add more educational content
-            explanations_html += f"<div style='margin-left:20px; font-size:0.9em;'>"
-            explanations_html += f"<p><strong>What it means:</strong> {ratio_info.get('description', 'No description available.')}</p>"
-            
-            explanations_html += f"<p><strong>How to interpret:</strong> {ratio_info.get('interpretation', 'No interpretation available.')}</p>"
-            
-            # Add ideal range information
-            ideal_key = 'value_stock_ideal' if analysis_type == 'value' else 'growth_stock_ideal'
-            explanations_html += f"<p><strong>Ideal range for {analysis_type.replace('_', '/')} investing:</strong> {ratio_info.get(ideal_key, 'No ideal range specified.')}</p>"
-            
-            # Add criteria information
-            criteria = None
-            if analysis_type == 'value' and ratio_name in VALUE_CRITERIA:
-                criteria = VALUE_CRITERIA[ratio_name]
-            elif analysis_type == 'growth_momentum' and ratio_name in GROWTH_MOMENTUM_CRITERIA:
-                criteria = GROWTH_MOMENTUM_CRITERIA[ratio_name]
-            
-            if criteria:
-                explanations_html += "<p><strong>Rating criteria:</strong></p>"
-                explanations_html += "<ul>"
-                for rating_name, (min_val, max_val) in criteria.items():
-                    min_str = f"{min_val:.2f}" if min_val != float('-inf') else "-∞"
-                    max_str = f"{max_val:.2f}" if max_val != float('inf') else "∞"
-                    rating_color = "green" if rating_name == "great" else "blue" if rating_name == "good" else "red"
-                    explanations_html += f"<li><span style='color:{rating_color};'>{rating_name.upper()}</span>: {min_str} to {max_str}</li>"
-                explanations_html += "</ul>"
-            
-            explanations_html += "</div></div>"
+            # Colored rating explanation followed by the precomputed educational content
+            parts.append(ratio_info['template'].format(color=color, explanation=explanation))
         else:
             # Fallback if no detailed info is available
-            explanations_html += f"<p><span style='color:{color};'>• {explanation}</span></p>"
+            parts.append(f"<p><span style='color:{color};'>• {explanation}</span></p>")
             
-    explanations_html += "</div>"
+    parts.append("</div>")
     
     # Combine all HTML sections
-    full_html = header + classification_html + table_html + summary_html + explanations_html
+    return "".join(parts)
+
+
+def print_report(report: Union[StockReport, str]) -> str:
+    """
+    Pretty print the stock analysis report with enhanced visuals.
     
-    # Display in Jupyter
-    display(HTML(full_html))
+    The report is rendered with render_report_html and displayed in Jupyter.
+    Without IPython, only the classification is printed.
+    
+    Args:
+        report (Union[StockReport, str]): Report object or error message
+    
+    Returns:
+        str: HTML content of the report
+    """
+    if isinstance(report, str):
+        print(report)
+        return report
+    
+    full_html = render_report_html(report)
+    
+    # Display in Jupyter (IPython is only imported when something is shown)
+    try:
+        from IPython.display import display, HTML
+    except ImportError:
+        print(f"{report.company_name} ({report.ticker}): {report.classification}")
+    else:
+        display(HTML(full_html))
     
     # Return HTML for potential saving
     return full_html
@@ -206,34 +226,28 @@ def save_report_html(report: StockReport, filename: str = None) -> str:
     if not filename.endswith('.html'):
         filename += '.html'
         
-    html_content = print_report(report)
+    # Build the report body without displaying it, then write it between the page head and foot
+    html_content = render_report_html(report)
     
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Stock Analysis: {report.ticker} - {report.analysis_type.title()}</title>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body>
-            {html_content}
-        </body>
-        </html>
-        """)
+        f.writelines([
+            _PAGE_HEAD.format(ticker=report.ticker, analysis_type=report.analysis_type.title()),
+            html_content,
+            _PAGE_FOOT
+        ])
     
     print(f"Report saved to {filename}")
     return filename
 
 
-def generate_comparison_markdown(comparison_data: Dict, title: str) -> str:
+def generate_comparison_markdown(comparison_data: Dict, title: str, display_inline: bool = False) -> str:
     """
     Generate a markdown-formatted comparison table.
     
     Args:
         comparison_data (Dict): Comparison data
         title (str): Title for the comparison
+        display_inline (bool): Whether to also render the markdown in Jupyter
         
     Returns:
         str: Markdown-formatted comparison
@@ -245,7 +259,9 @@ def generate_comparison_markdown(comparison_data: Dict, title: str) -> str:
         markdown_text += comparison_data['table']
         markdown_text += "\n\n"
     
-    # Display as Markdown
-    display(Markdown(markdown_text))
+    # Display as Markdown (IPython is only imported when asked to display)
+    if display_inline:
+        from IPython.display import display, Markdown
+        display(Markdown(markdown_text))
     
     return markdown_text
@@ -3,22 +3,106 @@ Data fetching utilities for stock analyzer.
 """
 
 import yfinance as yf
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 import pandas as pd
-from typing import Optional, Union, List
+from typing import Dict, Optional, Union, List
 
 from stock_analyzer.models.stock_data import StockData
+from stock_analyzer.utils.cache_utils import disk_cache, memory_cache, read_cache, write_cache
 
 
+# Benchmark index used for relative strength calculations
+MARKET_TICKER = "^GSPC"  # S&P 500
+
+# Maximum number of symbols requested per batched price download
+BATCH_SIZE = 20
+
+# How long fetched stock data is reused from the disk cache, in seconds (it includes the latest quote)
+STOCK_DATA_TTL = 60 * 60
+
+
+def _history_window():
+    """Return the (start, end) ISO dates covering the last year of prices, including today."""
+    today = date.today()
+    start_date = today - timedelta(days=365)  # Last year
+    end_date = today + timedelta(days=1)  # The end date is exclusive
+    return start_date.isoformat(), end_date.isoformat()
+
+
+def _close_only(prices: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keep only the Close column of a price history, the only one the analysis uses.
+    
+    Prices are stored as float32, which is plenty for returns rounded to basis
+    points and halves the memory (and disk cache) used per history.
+    """
+    if 'Close' in prices.columns:
+        return prices[['Close']].astype('float32')
+    return prices
+
+
+@memory_cache(maxsize=8)
+def _fetch_market(start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+    """
+    Download the market benchmark history, memoized per date window.
+    
+    Every ticker is compared against the same benchmark, so it only needs to be
+    downloaded once per day. yfinance returns an empty frame when the download
+    fails, so that is reported as None, which is not memoized and is retried on
+    the next call. Use _fetch_market.cache_clear() to force a refetch.
+    
+    Args:
+        start_date (str): First date of the window (YYYY-MM-DD)
+        end_date (str): Day after the last date of the window (YYYY-MM-DD)
+    
+    Returns:
+        pd.DataFrame: Daily closing prices of MARKET_TICKER, or None if none were found
+    """
+    prices = _close_only(yf.Ticker(MARKET_TICKER).history(start=start_date, end=end_date, interval="1d"))
+    return None if prices.empty else prices
+
+
+@memory_cache(maxsize=512, ttl=STOCK_DATA_TTL)
+@disk_cache(ttl=STOCK_DATA_TTL)
 def fetch_stock_data(ticker: str) -> Optional[StockData]:
     """
     Fetch all necessary stock data from external APIs.
     
     This function retrieves comprehensive stock information including basic info,
     financial statements, historical prices, and market comparison data.
+    Results are memoized per ticker in memory and cached on disk for
+    STOCK_DATA_TTL seconds, so the returned StockData is shared between callers
+    and must not be modified, and re-running a script or notebook within the hour
+    skips the network. Failed fetches (None) are not cached, so they are retried
+    on the next call. Use fetch_stock_data.cache_clear() and
+    set_cache_enabled(False) to force fresh data.
     
     Args:
         ticker (str): Stock ticker symbol (e.g., 'AAPL' for Apple)
+    
+    Returns:
+        StockData: A StockData object containing all fetched information,
+                  or None if data couldn't be retrieved
+    
+    Raises:
+        No exceptions are raised, errors are handled internally
+    """
+    return _fetch_stock_data(ticker)
+
+
+def _fetch_stock_data(ticker: str,
+                      historical_data: Optional[pd.DataFrame] = None,
+                      market_data: Optional[pd.DataFrame] = None) -> Optional[StockData]:
+    """
+    Fetch stock data, reusing any price histories that were already downloaded.
+    
+    Args:
+        ticker (str): Stock ticker symbol (e.g., 'AAPL' for Apple)
+        historical_data (pd.DataFrame, optional): Pre-fetched price history for the
+            ticker. If None, it is downloaded here.
+        market_data (pd.DataFrame, optional): Pre-fetched market benchmark history.
+            If None, it is downloaded here.
         
     Returns:
         StockData: A StockData object containing all fetched information,
@@ -54,31 +138,32 @@ def fetch_stock_data(ticker: str) -> Optional[StockData]:
             balance_sheet = pd.DataFrame()
             cash_flow = pd.DataFrame()
         
+        start_date, end_date = _history_window()
+        
         # Get historical data for price performance and other momentum metrics
-        try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=365)  # Last year
-            historical_data = stock.history(start=start_date, end=end_date, interval="1d")
-            
-            if historical_data.empty:
-                print(f"Warning: No historical data found for {ticker}")
-        except Exception as e:
-            print(f"Error fetching historical data for {ticker}: {str(e)}")
-            historical_data = pd.DataFrame()
+        if historical_data is None:
+            try:
+                historical_data = _close_only(stock.history(start=start_date, end=end_date, interval="1d"))
+                
+                if historical_data.empty:
+                    print(f"Warning: No historical data found for {ticker}")
+            except Exception as e:
+                print(f"Error fetching historical data for {ticker}: {str(e)}")
+                historical_data = pd.DataFrame()
         
         # Get market index data for relative strength calculation
-        try:
-            market_ticker = "^GSPC"  # S&P 500
-            market = yf.Ticker(market_ticker)
-            market_data = market.history(start=start_date, end=end_date, interval="1d")
-            
-            if market_data.empty:
-                print(f"Warning: No market data found for comparison")
-        except Exception as e:
-            print(f"Error fetching market data: {str(e)}")
-            market_data = pd.DataFrame()
+        if market_data is None:
+            try:
+                market_data = _fetch_market(start_date, end_date)
+                
+                if market_data is None:
+                    print(f"Warning: No market data found for comparison")
+                    market_data = pd.DataFrame()
+            except Exception as e:
+                print(f"Error fetching market data: {str(e)}")
+                market_data = pd.DataFrame()
         
-        # Create and return StockData object
+        # Create and return StockData object (it picks the current price out of the info)
         return StockData(
             ticker=ticker,
             info=stock_info,
@@ -86,29 +171,104 @@ def fetch_stock_data(ticker: str) -> Optional[StockData]:
             balance_sheet=balance_sheet,
             cash_flow=cash_flow,
             historical_data=historical_data,
-            market_data=market_data,
-            current_price=stock_info.get('currentPrice', stock_info.get('regularMarketPrice', None))
+            market_data=market_data
         )
     except Exception as e:
         print(f"Error fetching data for {ticker}: {str(e)}")
         return None
 
 
-def fetch_multiple_stocks(tickers: Union[List[str], str]) -> dict:
+def batch_fetch(tickers: List[str], chunk_size: int = BATCH_SIZE,
+                max_workers: int = 8) -> Dict[str, Optional[StockData]]:
+    """
+    Fetch data for many stocks, batching the price history downloads.
+    
+    Yahoo Finance serves price history for several symbols in a single request,
+    so the histories (plus the market benchmark) are downloaded in chunks of
+    `chunk_size` symbols instead of two requests per ticker. Company info and
+    financial statements are still fetched per ticker, using a thread pool so
+    the requests overlap while waiting on the network.
+    
+    Tickers already in fetch_stock_data's disk cache are served from it, and fresh
+    results are written back, so both functions share the same cached data.
+    
+    Args:
+        tickers (List[str]): List of stock ticker symbols
+        chunk_size (int): Maximum number of symbols per history request
+        max_workers (int): Maximum number of threads used for the per-ticker requests
+        
+    Returns:
+        Dict[str, Optional[StockData]]: StockData objects (or None on failure),
+                                        with tickers as keys
+    """
+    if not tickers:
+        return {}
+    
+    # Fetch repeated tickers only once (the result is keyed by ticker anyway)
+    tickers = list(dict.fromkeys(tickers))
+    
+    # Serve what we can from fetch_stock_data's disk cache
+    results = {ticker: read_cache(fetch_stock_data.__name__, (ticker,), ttl=STOCK_DATA_TTL)
+               for ticker in tickers}
+    missing = [ticker for ticker, stock_data in results.items() if stock_data is None]
+    if not missing:
+        return results
+    
+    symbols = list(dict.fromkeys([*missing, MARKET_TICKER]))
+    start_date, end_date = _history_window()
+    
+    histories = {}
+    for i in range(0, len(symbols), chunk_size):
+        chunk = symbols[i:i + chunk_size]
+        try:
+            prices = yf.download(chunk, start=start_date, end=end_date, interval="1d",
+                                 group_by='ticker', auto_adjust=True, progress=False)
+        except Exception as e:
+            print(f"Error batch fetching historical data for {', '.join(chunk)}: {str(e)}")
+            continue
+        
+        for symbol in chunk:
+            if isinstance(prices.columns, pd.MultiIndex):
+                if symbol not in prices.columns.get_level_values(0):
+                    continue
+                history = prices[symbol]
+            else:
+                history = prices
+            history = _close_only(history.dropna(how='all'))
+            # Leave failed symbols out so _fetch_stock_data retries them on its own
+            if not history.empty:
+                histories[symbol] = history
+    
+    market_data = histories.get(MARKET_TICKER)
+    
+    def fetch_one(ticker):
+        stock_data = _fetch_stock_data(ticker, histories.get(ticker), market_data)
+        write_cache(fetch_stock_data.__name__, (ticker,), stock_data)
+        return stock_data
+    
+    # No point starting more threads than there are tickers to fetch
+    workers = max(1, min(max_workers, len(missing)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results.update(zip(missing, executor.map(fetch_one, missing)))
+    return results
+
+
+def fetch_multiple_stocks(tickers: Union[List[str], str], max_workers: int = 8) -> dict:
     """
     Fetch data for multiple stocks.
     
+    Price histories (and the market benchmark) are downloaded in batches and the
+    remaining per-ticker requests run on a thread pool; see batch_fetch.
+    
     Args:
         tickers (Union[List[str], str]): List of tickers or comma-separated string
+        max_workers (int): Maximum number of threads used to fetch the tickers
         
     Returns:
-        dict: Dictionary of StockData objects, with tickers as keys
+        dict: Dictionary of StockData objects, with tickers as keys (each ticker
+              is fetched once, however often it is listed)
     """
     if isinstance(tickers, str):
         tickers = [ticker.strip() for ticker in tickers.split(',')]
-        
-    result = {}
-    for ticker in tickers:
-        result[ticker] = fetch_stock_data(ticker)
-        
-    return result
+    
+    return batch_fetch(tickers, max_workers=max_workers)
@@ -0,0 +1,45 @@
+"""
+Tests for the StockData price return properties.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.models.stock_data import StockData
+
+
+def _closes(seed, dtype):
+    """Build a year of random-walk closing prices with the given dtype."""
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.cumprod(1 + rng.normal(0.0005, 0.02, 252))
+    index = pd.date_range('2024-01-01', periods=prices.size, freq='B')
+    return pd.DataFrame({'Close': prices}, index=index).astype(dtype)
+
+
+def _stock_data(dtype):
+    """Build StockData for the same stock and market history stored as dtype."""
+    return StockData(
+        ticker='TEST',
+        info={'currentPrice': 100.0},
+        historical_data=_closes(1, dtype),
+        market_data=_closes(2, dtype)
+    )
+
+
+class TestFloat32Returns(unittest.TestCase):
+    """Returns computed from float32 prices must match the float64 reference."""
+    
+    def test_returns_match_float64(self):
+        reference = _stock_data('float64')
+        compact = _stock_data('float32')
+        self.assertEqual(compact.close_arr.dtype, np.float32)
+        
+        for name in ('returns_6m', 'returns_1y', 'relative_strength'):
+            with self.subTest(name=name):
+                self.assertAlmostEqual(getattr(compact, name), getattr(reference, name), delta=1e-5)
+
+
+if __name__ == '__main__':
+    unittest.main()